@@ -0,0 +1 @@
+"""Benchmarks of the Eaton ePDU integration."""
@@ -0,0 +1,299 @@
+"""Benchmark the polling hot paths against an in-process fake ePDU.
+
+Run from the repository root in an environment with Home Assistant installed:
+
+    python -m benchmarks [--polls 50] [--topology 4x48]
+    python -m benchmarks --trace eaton_epdu_<entry_id>.trace.gz [--loss 0.05]
+
+No network access is needed, all SNMP requests are answered by the fake agent
+or replayed from a trace recorded with the "Record SNMP traffic" option.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+import inspect
+import logging
+import time
+import tracemalloc
+from unittest.mock import MagicMock
+
+from custom_components.eaton_epdu.api import SnmpApi
+from custom_components.eaton_epdu.const import (
+    ATTR_COMMUNITY,
+    ATTR_HOST,
+    ATTR_VERSION,
+    ATTR_VERSION_WRITE,
+    SNMP_OID_INPUTS_CURRENT,
+    SNMP_OID_INPUTS_VOLTAGE,
+    SNMP_OID_INPUTS_WATTS,
+    SNMP_OID_OUTLETS_CURRENT,
+    SNMP_OID_OUTLETS_STATUS,
+    SNMP_OID_OUTLETS_WATTS,
+    SNMP_OID_UNITS_DEVICE_NAME,
+    SNMP_OID_UNITS_FIRMWARE_VERSION,
+    SNMP_OID_UNITS_INPUT_COUNT,
+    SNMP_OID_UNITS_OUTLET_COUNT,
+    SNMP_OID_UNITS_PART_NUMBER,
+    SNMP_OID_UNITS_PRODUCT_NAME,
+    SNMP_OID_UNITS_SERIAL_NUMBER,
+    SnmpVersion,
+    SnmpVersionWrite,
+)
+from custom_components.eaton_epdu.coordinator import SnmpCoordinator
+from custom_components.eaton_epdu.registry import OidRegistry
+from custom_components.eaton_epdu.trace import TraceReplay
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .agent import FakeAgent, build_table, serve
+
+_LOGGER = logging.getLogger(__name__)
+
+TOPOLOGIES = ("1x8", "1x24", "2x48", "4x48")
+
+# Errors of failed requests and polls, counted as failures of a call.
+CALL_ERRORS = (RuntimeError, UpdateFailed)
+
+# Requested like the coordinator does, so they can be found in a trace.
+IDENTITY_OIDS = (
+    SNMP_OID_UNITS_PRODUCT_NAME,
+    SNMP_OID_UNITS_PART_NUMBER,
+    SNMP_OID_UNITS_SERIAL_NUMBER,
+    SNMP_OID_UNITS_FIRMWARE_VERSION,
+    SNMP_OID_UNITS_DEVICE_NAME,
+    SNMP_OID_UNITS_INPUT_COUNT,
+    SNMP_OID_UNITS_OUTLET_COUNT,
+)
+
+METRIC_OIDS = (
+    SNMP_OID_INPUTS_CURRENT,
+    SNMP_OID_INPUTS_VOLTAGE,
+    SNMP_OID_INPUTS_WATTS,
+    SNMP_OID_OUTLETS_CURRENT,
+    SNMP_OID_OUTLETS_STATUS,
+    SNMP_OID_OUTLETS_WATTS,
+)
+
+
+class Result:
+    """Measurements of a benchmarked operation, averaged per call."""
+
+    def __init__(self, name: str, unit: str = "us") -> None:
+        """Initialize the result."""
+        self.name = name
+        self.unit = unit
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.requests = 0
+        self.varbinds = 0
+        self.peak = 0
+        self.failures = 0
+
+    def __str__(self) -> str:
+        """Return the result as a table row."""
+        calls = max(self.calls, 1)
+        scale = {"ms": 1e3, "us": 1e6, "ns": 1e9}[self.unit]
+        return (
+            f"  {self.name:<24}"
+            f"{self.wall / calls * scale:>10.2f} {self.unit:<2} wall"
+            f"{self.cpu / calls * scale:>10.2f} {self.unit:<2} cpu"
+            f"{self.requests / calls:>8.1f} rt"
+            f"{self.varbinds / calls:>8.1f} vb"
+            f"{self.peak / 1024:>9.1f} KiB peak"
+            + (f"{self.failures:>5} failed" if self.failures else "")
+        )
+
+
+async def measure(
+    result: Result,
+    agent: FakeAgent,
+    func: Callable,
+    calls: int,
+    before: Callable[[], None] | None = None,
+) -> Result:
+    """Time the calls, then repeat one call to trace its allocations."""
+    for _ in range(calls):
+        if before is not None:
+            before()
+        agent.reset()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            if inspect.isawaitable(value := func()):
+                await value
+        except CALL_ERRORS:
+            result.failures += 1
+        result.wall += time.perf_counter() - wall
+        result.cpu += time.process_time() - cpu
+        result.requests += agent.requests
+        result.varbinds += agent.varbinds
+        result.calls += 1
+
+    if before is not None:
+        before()
+    tracemalloc.start()
+    try:
+        if inspect.isawaitable(value := func()):
+            await value
+    except CALL_ERRORS as err:
+        _LOGGER.warning("Traced call of %s failed: %s", result.name, err)
+    finally:
+        result.peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+
+async def create_coordinator() -> SnmpCoordinator:
+    """Return a coordinator with an API set up for the fake agent."""
+    entry = MagicMock(
+        entry_id="benchmark",
+        data={
+            ATTR_HOST: "127.0.0.1",
+            ATTR_VERSION: SnmpVersion.V1,
+            ATTR_COMMUNITY: "public",
+            ATTR_VERSION_WRITE: SnmpVersionWrite.NO_Version,
+        },
+    )
+    api = SnmpApi(None)
+    await api.setup(entry)
+    return SnmpCoordinator(MagicMock(), entry, api)
+
+
+async def benchmark_polls(
+    agent: FakeAgent | TraceReplay,
+    polls: int,
+    before: Callable[[], None] | None = None,
+) -> list[Result]:
+    """Run the benchmarks of the polling path."""
+    results = []
+    with serve(agent):
+        coordinator = await create_coordinator()
+        api = coordinator._api
+
+        results.append(
+            await measure(
+                Result("discovery poll", "ms"),
+                agent,
+                lambda: _discover(coordinator),
+                max(polls // 10, 1),
+            )
+        )
+        results.append(
+            await measure(
+                Result("poll", "ms"), agent, coordinator._update_data, polls, before
+            )
+        )
+
+        unit = coordinator.get_units()[0]
+        oids = [oid.replace("unit", unit) for oid in IDENTITY_OIDS]
+        results.append(
+            await measure(Result("SnmpApi.get"), agent, lambda: api.get(oids), polls)
+        )
+
+        _, tables = coordinator._get_due_tables()
+        results.append(
+            await measure(
+                Result("SnmpApi.get_table"),
+                agent,
+                lambda: asyncio.gather(*(api.get_table(table) for table in tables)),
+                polls,
+            )
+        )
+    return results
+
+
+async def benchmark(topology: str, polls: int) -> list[Result]:
+    """Run all benchmarks for a topology given as units x outlets."""
+    units, outlets = (int(part) for part in topology.split("x"))
+    agent = FakeAgent(build_table(units, outlets))
+    unit_ids = [str(unit) for unit in range(units)]
+    results = await benchmark_polls(agent, polls, agent.drift)
+
+    values = list(agent.table.values())
+    decode = Result(f"SnmpApi.decode x{len(values)}")
+    results.append(
+        await measure(
+            decode, agent, lambda: [SnmpApi.decode(value) for value in values], polls
+        )
+    )
+
+    indexes = [str(index) for index in range(1, outlets + 1)]
+
+    def build_oids(registry: OidRegistry) -> None:
+        for unit in unit_ids:
+            for index in indexes:
+                for metric in METRIC_OIDS:
+                    registry.get(metric, unit, index)
+
+    count = len(unit_ids) * len(indexes) * len(METRIC_OIDS)
+    results.append(
+        await measure(
+            Result(f"OID cold x{count}"),
+            agent,
+            lambda: build_oids(OidRegistry()),
+            polls,
+        )
+    )
+    registry = OidRegistry()
+    build_oids(registry)
+    results.append(
+        await measure(
+            Result(f"OID cached x{count}"),
+            agent,
+            lambda: build_oids(registry),
+            polls,
+        )
+    )
+
+    return results
+
+
+async def _discover(coordinator: SnmpCoordinator) -> None:
+    """Poll once with a forced metadata refresh."""
+    coordinator._metadata_updated = None
+    await coordinator._update_data()
+
+
+async def main() -> None:
+    """Parse the arguments and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=50, help="calls per benchmark")
+    parser.add_argument(
+        "--topology",
+        action="append",
+        help="units x outlets per unit, e.g. 4x48 (default: all)",
+    )
+    parser.add_argument("--trace", help="replay a recorded trace instead")
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="seconds to delay replayed responses, -1 for the recorded times",
+    )
+    parser.add_argument(
+        "--loss", type=float, default=0.0, help="share of lost replayed requests"
+    )
+    args = parser.parse_args()
+
+    if args.trace:
+        agent = TraceReplay(
+            args.trace,
+            latency=None if args.latency < 0 else args.latency,
+            loss=args.loss,
+            seed=0,
+        )
+        print(args.trace)
+        for result in await benchmark_polls(agent, args.polls):
+            print(result)
+        print(f"  {agent.misses} request(s) not found in the trace")
+        return
+
+    for topology in args.topology or TOPOLOGIES:
+        print(f"{topology} (units x outlets)")
+        for result in await benchmark(topology, args.polls):
+            print(result)
+
+
+asyncio.run(main())
@@ -0,0 +1,200 @@
+"""In-process fake ePDU agent standing in for the pysnmp hlapi commands."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from contextlib import contextmanager
+import random
+
+import pysnmp.hlapi.asyncio as hlapi
+from pysnmp.proto.rfc1902 import Integer, ObjectName, OctetString, TimeTicks
+from pysnmp.proto.rfc1905 import endOfMibView, noSuchObject
+from pysnmp.smi import view
+
+from custom_components.eaton_epdu import api
+from custom_components.eaton_epdu.const import (
+    SNMP_OID_INPUTS_CURRENT,
+    SNMP_OID_INPUTS_FEED_NAME,
+    SNMP_OID_INPUTS_PF,
+    SNMP_OID_INPUTS_VOLTAGE,
+    SNMP_OID_INPUTS_WATT_HOURS,
+    SNMP_OID_INPUTS_WATTS,
+    SNMP_OID_OUTLETS_CURRENT,
+    SNMP_OID_OUTLETS_DESIGNATOR,
+    SNMP_OID_OUTLETS_ID,
+    SNMP_OID_OUTLETS_NAME,
+    SNMP_OID_OUTLETS_PF,
+    SNMP_OID_OUTLETS_STATUS,
+    SNMP_OID_OUTLETS_SWITCH_OFF,
+    SNMP_OID_OUTLETS_SWITCH_ON,
+    SNMP_OID_OUTLETS_WATT_HOURS,
+    SNMP_OID_OUTLETS_WATTS,
+    SNMP_OID_SYSTEM_UPTIME,
+    SNMP_OID_UNITS,
+    SNMP_OID_UNITS_DEVICE_NAME,
+    SNMP_OID_UNITS_FIRMWARE_VERSION,
+    SNMP_OID_UNITS_INPUT_COUNT,
+    SNMP_OID_UNITS_OUTLET_COUNT,
+    SNMP_OID_UNITS_PART_NUMBER,
+    SNMP_OID_UNITS_PRODUCT_NAME,
+    SNMP_OID_UNITS_SERIAL_NUMBER,
+)
+
+# Columns whose values drift between polls like real measurements.
+VOLATILE_COLUMNS = (
+    SNMP_OID_INPUTS_CURRENT,
+    SNMP_OID_INPUTS_WATTS,
+    SNMP_OID_OUTLETS_CURRENT,
+    SNMP_OID_OUTLETS_WATTS,
+)
+
+
+def build_table(units: int, outlets: int, inputs: int = 1) -> dict:
+    """Return the MIB view of an ePDU daisy chain."""
+    table = {
+        SNMP_OID_SYSTEM_UPTIME: TimeTicks(100000),
+        SNMP_OID_UNITS: OctetString(",".join(str(unit) for unit in range(units))),
+    }
+    for unit in map(str, range(units)):
+        for oid, value in (
+            (SNMP_OID_UNITS_PRODUCT_NAME, OctetString("Eaton ePDU")),
+            (SNMP_OID_UNITS_PART_NUMBER, OctetString("EMAB03")),
+            (SNMP_OID_UNITS_SERIAL_NUMBER, OctetString(f"BENCH{unit}")),
+            (SNMP_OID_UNITS_FIRMWARE_VERSION, OctetString("03.01.02")),
+            (SNMP_OID_UNITS_DEVICE_NAME, OctetString(f"ePDU {unit}")),
+            (SNMP_OID_UNITS_INPUT_COUNT, Integer(inputs)),
+            (SNMP_OID_UNITS_OUTLET_COUNT, Integer(outlets)),
+        ):
+            table[oid.replace("unit", unit)] = value
+
+        for index in map(str, range(1, inputs + 1)):
+            for oid, value in (
+                (SNMP_OID_INPUTS_FEED_NAME, OctetString(f"Feed {index}")),
+                (SNMP_OID_INPUTS_VOLTAGE, Integer(230000)),
+                (SNMP_OID_INPUTS_CURRENT, Integer(8000)),
+                (SNMP_OID_INPUTS_PF, Integer(950)),
+                (SNMP_OID_INPUTS_WATTS, Integer(1750)),
+                (SNMP_OID_INPUTS_WATT_HOURS, Integer(123456789)),
+            ):
+                table[oid.replace("unit", unit).replace("index", index)] = value
+
+        for index in map(str, range(1, outlets + 1)):
+            for oid, value in (
+                (SNMP_OID_OUTLETS_ID, OctetString(f"A{index}")),
+                (SNMP_OID_OUTLETS_NAME, OctetString(f"Outlet A{index}")),
+                (SNMP_OID_OUTLETS_DESIGNATOR, OctetString(f"A{index}")),
+                (SNMP_OID_OUTLETS_CURRENT, Integer(160)),
+                (SNMP_OID_OUTLETS_PF, Integer(900)),
+                (SNMP_OID_OUTLETS_WATTS, Integer(35)),
+                (SNMP_OID_OUTLETS_WATT_HOURS, Integer(1234567)),
+                (SNMP_OID_OUTLETS_STATUS, Integer(1)),
+                (SNMP_OID_OUTLETS_SWITCH_ON, Integer(-1)),
+                (SNMP_OID_OUTLETS_SWITCH_OFF, Integer(-1)),
+            ):
+                table[oid.replace("unit", unit).replace("index", index)] = value
+
+    return table
+
+
+def _key(oid: str) -> tuple[int, ...]:
+    """Return the sort key of an OID."""
+    return tuple(int(part) for part in oid.split("."))
+
+
+class FakeAgent:
+    """Serve GET, GETBULK and SET requests from a table without any I/O.
+
+    Object types are resolved with a MIB view like pysnmp does, so the
+    benchmark includes that cost.
+    """
+
+    def __init__(self, table: dict, seed: int = 0) -> None:
+        """Initialize the agent."""
+        self.table = table
+        self._oids = sorted(table, key=_key)
+        self._keys = [_key(oid) for oid in self._oids]
+        self._mib_view = view.MibViewController(hlapi.SnmpEngine().get_mib_builder())
+        self._random = random.Random(seed)
+        self.requests = 0
+        self.varbinds = 0
+
+    def reset(self) -> None:
+        """Reset the request counters."""
+        self.requests = 0
+        self.varbinds = 0
+
+    def drift(self, ratio: float = 0.3) -> None:
+        """Change a share of the volatile values like a changing load."""
+        prefixes = tuple(oid.split(".unit")[0] + "." for oid in VOLATILE_COLUMNS)
+        for oid, value in self.table.items():
+            if oid.startswith(prefixes) and self._random.random() < ratio:
+                self.table[oid] = Integer(int(value) + self._random.randint(-5, 5))
+
+    def _oid(self, object_type) -> str:
+        """Return the OID of a request variable binding."""
+        return str(object_type.resolve_with_mib(self._mib_view)[0])
+
+    def _next(self, oid: str) -> tuple:
+        """Return the variable binding following an OID."""
+        position = bisect_right(self._keys, _key(oid))
+        if position >= len(self._oids):
+            return ObjectName(oid), endOfMibView
+        next_oid = self._oids[position]
+        return ObjectName(next_oid), self.table[next_oid]
+
+    async def get_cmd(self, engine, auth, target, context, *var_binds, **options):
+        """Answer a GET request."""
+        self.requests += 1
+        self.varbinds += len(var_binds)
+        response = []
+        for var_bind in var_binds:
+            oid = self._oid(var_bind)
+            response.append((ObjectName(oid), self.table.get(oid, noSuchObject)))
+        return None, 0, 0, tuple(response)
+
+    async def bulk_cmd(
+        self,
+        engine,
+        auth,
+        target,
+        context,
+        non_repeaters,
+        max_repetitions,
+        *var_binds,
+        **options,
+    ):
+        """Answer a GETBULK request."""
+        self.requests += 1
+        oids = [self._oid(var_bind) for var_bind in var_binds]
+        response = [self._next(oid) for oid in oids[:non_repeaters]]
+        cursors = oids[non_repeaters:]
+        for _ in range(max_repetitions if cursors else 0):
+            row = [self._next(oid) for oid in cursors]
+            response.extend(row)
+            cursors = [str(var_bind[0]) for var_bind in row]
+        self.varbinds += len(response)
+        return None, 0, 0, tuple(response)
+
+    async def set_cmd(self, engine, auth, target, context, *var_binds, **options):
+        """Answer a SET request."""
+        self.requests += 1
+        self.varbinds += len(var_binds)
+        for var_bind in var_binds:
+            oid = self._oid(var_bind)
+            self.table[oid] = var_bind[1]
+        return None, 0, 0, var_binds
+
+
+@contextmanager
+def serve(agent: FakeAgent):
+    """Route the hlapi commands used by the integration to the agent."""
+    commands = {
+        name: getattr(api.hlapi, name) for name in ("get_cmd", "bulk_cmd", "set_cmd")
+    }
+    try:
+        for name in commands:
+            setattr(api.hlapi, name, getattr(agent, name))
+        yield agent
+    finally:
+        for name, command in commands.items():
+            setattr(api.hlapi, name, command)
@@ -5,31 +5,68 @@ from __future__ import annotations
 from homeassistant.components.snmp import async_get_snmp_engine
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers.typing import ConfigType
 
 from .api import SnmpApi
-from .const import PLATFORMS
-from .coordinator import SnmpCoordinator
+from .const import ATTR_RECORD_TRACE, DOMAIN, PLATFORMS
+from .coordinator import SnmpCoordinator, get_profile_store
+from .scheduler import PollScheduler
+from .services import async_setup_services
+from .trace import TraceRecorder
+from .traps import async_setup_trap_receiver, async_unload_trap_receiver
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Eaton ePDU services."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Eaton ePDU from a config entry."""
+    scheduler = hass.data.setdefault(DOMAIN, PollScheduler())
     snmpEngine = await async_get_snmp_engine(hass)
-    api = SnmpApi(snmpEngine)
+    api = SnmpApi(snmpEngine, scheduler.semaphore)
     await api.setup(entry)
-    coordinator = SnmpCoordinator(hass=hass, entry=entry, api=api)
-    await coordinator.async_config_entry_first_refresh()
+    if entry.data.get(ATTR_RECORD_TRACE, False):
+        api.recorder = TraceRecorder(
+            hass.config.path(f"{DOMAIN}_{entry.entry_id}.trace.gz")
+        )
+    coordinator = SnmpCoordinator(hass=hass, entry=entry, api=api, scheduler=scheduler)
+    await coordinator.async_load_profile()
+    if coordinator.restore_snapshot():
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     entry.runtime_data = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await async_setup_trap_receiver(hass, entry, coordinator)
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    async_unload_trap_receiver(hass, entry)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok and (scheduler := hass.data.get(DOMAIN)) is not None:
+        scheduler.unregister(entry.entry_id)
+        if not scheduler.entries:
+            hass.data.pop(DOMAIN)
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored device profile of a config entry."""
+    await get_profile_store(hass, entry.entry_id).async_remove()
 
 
 async def async_remove_config_entry_device(
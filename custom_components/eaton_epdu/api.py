@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import nullcontext
+import copy
 import logging
+import re
+import time
 
+from pyasn1.type import univ
+from pysnmp.entity.config import AUTH_SERVICES, PRIV_SERVICES
 from pysnmp.error import PySnmpError
 import pysnmp.hlapi.asyncio as hlapi
 from pysnmp.hlapi.asyncio import SnmpEngine
+from pysnmp.proto import errind
 from pysnmp.proto.rfc1902 import Integer, OctetString
+from pysnmp.proto.rfc1905 import EndOfMibView, NoSuchInstance, NoSuchObject
 
 from homeassistant.config_entries import ConfigEntry
 
@@ -18,21 +27,39 @@ from .const import (
     ATTR_AUTH_PROTOCOL_WRITE,
     ATTR_COMMUNITY,
     ATTR_COMMUNITY_WRITE,
+    ATTR_HEDGE_REQUESTS,
     ATTR_HOST,
+    ATTR_MAX_REQUESTS,
     ATTR_PORT,
     ATTR_PRIV_KEY,
     ATTR_PRIV_KEY_WRITE,
     ATTR_PRIV_PROTOCOL,
     ATTR_PRIV_PROTOCOL_WRITE,
+    ATTR_RETRIES,
+    ATTR_TIMEOUT_MAX,
+    ATTR_TIMEOUT_MIN,
     ATTR_USERNAME,
     ATTR_USERNAME_WRITE,
     ATTR_VERSION,
     ATTR_VERSION_WRITE,
+    HEDGE_MIN_SAMPLES,
+    MAX_REQUESTS_DEFAULT,
+    SNMP_MAX_VARBINDS_DEFAULT,
     SNMP_PORT_DEFAULT,
+    SNMP_RETRIES_DEFAULT,
+    SNMP_TIMEOUT_INITIAL,
+    SNMP_TIMEOUT_MAX_DEFAULT,
+    SNMP_TIMEOUT_MIN_DEFAULT,
+    UNSUPPORTED_OID_TTL,
     AuthProtocol,
     PrivProtocol,
+    RequestPriority,
     SnmpVersion,
 )
+from .registry import OidRegistry
+from .scheduler import PrioritySemaphore
+from .stats import RequestStats, RttEstimator, VarBindLimit
+from .trace import TRACE_FLUSH_RECORDS, TraceRecorder
 
 AUTH_MAP = {
     AuthProtocol.NO_AUTH: hlapi.usmNoAuthProtocol,
@@ -55,8 +82,103 @@ PRIV_MAP = {
     PrivProtocol.AES_BLUMENTHAL_256: hlapi.usmAesBlumenthalCfb256Protocol,
 }
 
+# Error status of a response which would exceed the message size of the agent.
+ERROR_STATUS_TOO_BIG = 1
+
 _LOGGER = logging.getLogger(__name__)
 
+# Labels may hold numbers, which are returned as numbers like any other value.
+INT_PATTERN = re.compile(r"\s*[+-]?\d+(?:_\d+)*\s*")
+FLOAT_PATTERN = re.compile(r"\s*[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?\s*")
+
+
+def decode_string(value: OctetString) -> str | int | float:
+    """Decode an octet string into a string or the number it holds."""
+    text = str(value)
+    if INT_PATTERN.fullmatch(text):
+        return int(text)
+    if FLOAT_PATTERN.fullmatch(text):
+        return float(text)
+    return text
+
+
+# Decoders by base type, covering Integer32, Unsigned32, Gauge32, Counter32,
+# Counter64, TimeTicks, OctetString, IpAddress, Opaque and ObjectIdentifier.
+DECODERS = {
+    univ.Integer: int,
+    univ.OctetString: decode_string,
+    univ.ObjectIdentifier: str,
+}
+
+# Decoders by exact type, filled on first use of each type.
+_decoders = {}
+
+
+def _get_decoder(value_type: type):
+    """Return and remember the decoder of a value type."""
+    decoder = next(
+        (DECODERS[base] for base in value_type.__mro__ if base in DECODERS), str
+    )
+    _decoders[value_type] = decoder
+    return decoder
+
+
+# Master keys by protocols and pass phrases, shared by all config entries.
+_master_keys: dict[tuple, tuple] = {}
+
+
+def hash_passphrases(auth_protocol, auth_key, priv_protocol, priv_key) -> tuple:
+    """Return the master keys of the pass phrases, None keeps a pass phrase.
+
+    Hashing a pass phrase digests 1 MB of data, so this runs in the executor.
+    Without a protocol, the one UsmUserData defaults to for a key is used.
+    """
+    auth_protocol = auth_protocol or hlapi.usmHMACMD5AuthProtocol
+    priv_protocol = priv_protocol or hlapi.usmDESPrivProtocol
+    master_auth_key = master_priv_key = None
+    if auth_key is not None and auth_protocol != hlapi.usmNoAuthProtocol:
+        master_auth_key = AUTH_SERVICES[auth_protocol].hash_passphrase(
+            OctetString(auth_key)
+        )
+        if priv_key is not None and priv_protocol != hlapi.usmNoPrivProtocol:
+            master_priv_key = PRIV_SERVICES[priv_protocol].hash_passphrase(
+                auth_protocol, OctetString(priv_key)
+            )
+    return master_auth_key, master_priv_key
+
+
+async def create_usm_user_data(
+    username, auth_key, priv_key, auth_protocol, priv_protocol
+) -> hlapi.UsmUserData:
+    """Return user data with cached master keys instead of pass phrases.
+
+    pysnmp localizes master keys to each engine ID itself, which is cheap.
+    """
+    key = (auth_protocol, auth_key, priv_protocol, priv_key)
+    if key not in _master_keys and (auth_key is not None or priv_key is not None):
+        _master_keys[key] = await asyncio.get_running_loop().run_in_executor(
+            None, hash_passphrases, *key
+        )
+    master_auth_key, master_priv_key = _master_keys.get(key, (None, None))
+
+    return hlapi.UsmUserData(
+        username,
+        auth_key if master_auth_key is None else master_auth_key,
+        priv_key if master_priv_key is None else master_priv_key,
+        auth_protocol,
+        priv_protocol,
+        authKeyType=(
+            hlapi.usmKeyTypePassphrase
+            if master_auth_key is None
+            else hlapi.usmKeyTypeMaster
+        ),
+        privKeyType=(
+            hlapi.usmKeyTypePassphrase
+            if master_priv_key is None
+            else hlapi.usmKeyTypeMaster
+        ),
+    )
+
 
 class SnmpApi:
     """Provide an api for Eaton ePDU."""
@@ -67,19 +189,48 @@ class SnmpApi:
     _version: str
     _version_write: str | None
 
-    def __init__(self, snmpEngine: SnmpEngine) -> None:
+    def __init__(
+        self, snmpEngine: SnmpEngine, limiter: PrioritySemaphore | None = None
+    ) -> None:
         """Init the SnmpApi."""
         self._snmpEngine = snmpEngine
+        self._limiter = limiter
+        self._firmware: str | None = None
+        self._unsupported: dict[str, float] = {}
+        self.registry = OidRegistry()
+        self.recorder: TraceRecorder | None = None
+        self.stats = RequestStats()
+        self.rtt = RttEstimator(
+            SNMP_TIMEOUT_MIN_DEFAULT, SNMP_TIMEOUT_MAX_DEFAULT, SNMP_TIMEOUT_INITIAL
+        )
+        self._retries = SNMP_RETRIES_DEFAULT
+        self._hedge = False
+        # Variable bindings per GET or SET request and per GETBULK response.
+        self._max_varbinds = VarBindLimit(SNMP_MAX_VARBINDS_DEFAULT)
+        self._max_bulk_varbinds = VarBindLimit(SNMP_MAX_VARBINDS_DEFAULT)
+        self._semaphore = PrioritySemaphore(MAX_REQUESTS_DEFAULT)
 
     async def setup(self, entry: ConfigEntry) -> None:
         """Setup the SnmpApi."""
+        self._semaphore = PrioritySemaphore(
+            entry.data.get(ATTR_MAX_REQUESTS, MAX_REQUESTS_DEFAULT)
+        )
+        self.rtt = RttEstimator(
+            entry.data.get(ATTR_TIMEOUT_MIN, SNMP_TIMEOUT_MIN_DEFAULT),
+            entry.data.get(ATTR_TIMEOUT_MAX, SNMP_TIMEOUT_MAX_DEFAULT),
+            SNMP_TIMEOUT_INITIAL,
+        )
+        self._retries = entry.data.get(ATTR_RETRIES, SNMP_RETRIES_DEFAULT)
+        self._hedge = entry.data.get(ATTR_HEDGE_REQUESTS, False)
+
         try:
             self._target = await hlapi.UdpTransportTarget.create(
                 (
                     entry.data.get(ATTR_HOST),
                     entry.data.get(ATTR_PORT, SNMP_PORT_DEFAULT),
                 ),
-                10,
+                self.rtt.timeout,
+                0,
             )
         except PySnmpError:
             try:
@@ -88,7 +239,8 @@ class SnmpApi:
                         entry.data.get(ATTR_HOST),
                         entry.data.get(ATTR_PORT, SNMP_PORT_DEFAULT),
                     ),
-                    10,
+                    self.rtt.timeout,
+                    0,
                 )
             except PySnmpError as err:
                 _LOGGER.error("Invalid SNMP host: %s", err)
@@ -100,7 +252,7 @@ class SnmpApi:
                 entry.data.get(ATTR_COMMUNITY), mpModel=0
             )
         elif self._version == SnmpVersion.V3:
-            self._credentials = hlapi.UsmUserData(
+            self._credentials = await create_usm_user_data(
                 entry.data.get(ATTR_USERNAME),
                 entry.data.get(ATTR_AUTH_KEY),
                 entry.data.get(ATTR_PRIV_KEY),
@@ -114,7 +266,7 @@ class SnmpApi:
                 entry.data.get(ATTR_COMMUNITY_WRITE), mpModel=0
             )
         elif self._version_write == SnmpVersion.V3:
-            self._credentials_write = hlapi.UsmUserData(
+            self._credentials_write = await create_usm_user_data(
                 entry.data.get(ATTR_USERNAME_WRITE),
                 entry.data.get(ATTR_AUTH_KEY_WRITE),
                 entry.data.get(ATTR_PRIV_KEY_WRITE),
@@ -128,48 +280,276 @@ class SnmpApi:
         else:
             self._credentials_write = None
 
-    @staticmethod
-    def construct_object_types(list_of_oids):
-        """Prepare desired objects from list of OIDs."""
-        object_types = []
-        for oid in list_of_oids:
-            object_types.append(hlapi.ObjectType(hlapi.ObjectIdentity(oid)))
-        return object_types
-
-    async def get(self, oids) -> dict:
-        """Get data for given OIDs in a single call."""
-        while len(oids):
-            _LOGGER.debug("Get OID(s) %s", oids)
+    async def _request(
+        self,
+        command,
+        credentials,
+        *args,
+        priority: RequestPriority = RequestPriority.POLL,
+        **kwargs,
+    ) -> tuple:
+        """Send a request while limiting the requests in flight to the device.
+
+        Requests of a higher priority take the next free slot, so commands do
+        not queue behind the requests of a poll. Lost requests are sent again
+        with a doubled timeout, starting from the timeout derived from the
+        round trip times of the device.
+        """
+        if self.recorder is not None and self.recorder.pending >= TRACE_FLUSH_RECORDS:
+            await self.recorder.async_flush()
+
+        # Reads may be sent twice, writes are only repeated once timed out.
+        hedge = self._hedge and command is not hlapi.set_cmd
+        varbinds_sent = len(args) - 2 if command is hlapi.bulk_cmd else len(args)
+
+        # The fleet wide limit is only taken once the device has a free slot.
+        async with (
+            self._semaphore.slot(priority),
+            self._limiter.slot(priority) if self._limiter else nullcontext(),
+        ):
+            timeout = self.rtt.timeout
+            for attempt in range(self._retries + 1):
+                if attempt:
+                    timeout = self.rtt.bound(timeout * 2)
+                    self.stats.timeout_retries += 1
+                    _LOGGER.debug("Request timed out, retry with %.1fs", timeout)
+
+                if hedge:
+                    response, rtt = await self._send_hedged(
+                        command, credentials, timeout, args, kwargs
+                    )
+                else:
+                    response, rtt = await self._send(
+                        command, credentials, timeout, args, kwargs
+                    )
+
+                timed_out = isinstance(response[0], errind.RequestTimedOut)
+                if not timed_out:
+                    self.rtt.add(rtt)
+                if self.recorder is not None:
+                    self.recorder.record(command, args, response, rtt)
+                # Counted last, so the caller decodes the response before the
+                # next one.
+                self.stats.add_request(command.__name__, varbinds_sent, response, rtt)
+                if not timed_out:
+                    break
+
+        return response
+
+    async def _send(
+        self, command, credentials, timeout: float, args: tuple, kwargs: dict
+    ) -> tuple[tuple, float]:
+        """Send a request once and return the response and its round trip time.
+
+        Each attempt has its own request ID, so a late response to an earlier
+        attempt is dropped and round trip times are never ambiguous.
+        """
+        target = copy.copy(self._target)
+        target.timeout = timeout
+        target.retries = 0
+        start = time.monotonic()
+        response = await command(
+            self._snmpEngine,
+            credentials,
+            target,
+            hlapi.ContextData(),
+            *args,
+            **kwargs,
+        )
+        return response, time.monotonic() - start
 
-            (
-                error_indication,
-                error_status,
-                error_index,
-                var_binds,
-            ) = await hlapi.get_cmd(
-                self._snmpEngine,
-                self._credentials,
-                self._target,
-                hlapi.ContextData(),
-                *__class__.construct_object_types(oids),
-            )
+    async def _send_hedged(
+        self, command, credentials, timeout: float, args: tuple, kwargs: dict
+    ) -> tuple[tuple, float]:
+        """Send a request and send it again if it is slower than usual.
 
-            if error_index:
-                _LOGGER.debug("Remove error index %d", error_index - 1)
-                oids.pop(error_index - 1)
-                continue
+        The second request is sent once the 95th percentile of the recent round
+        trip times has passed, and the first answer wins.
+        """
+        delay = None
+        if len(self.stats.rtts) >= HEDGE_MIN_SAMPLES:
+            delay = self.stats.rtt_percentile(95)
+        first = asyncio.ensure_future(
+            self._send(command, credentials, timeout, args, kwargs)
+        )
+        if delay is None or delay >= timeout:
+            return await first
 
-            if error_indication or error_status:
-                raise RuntimeError(
-                    f"Got SNMP error: {error_indication} {error_status} {error_index}"
+        tasks = [first]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return first.result()
+
+            self.stats.hedges += 1
+            tasks.append(
+                asyncio.ensure_future(
+                    self._send(
+                        command,
+                        credentials,
+                        self.rtt.bound(timeout - delay),
+                        args,
+                        kwargs,
+                    )
                 )
+            )
+            for task in asyncio.as_completed(tasks):
+                response, rtt = await task
+                if not isinstance(response[0], errind.RequestTimedOut):
+                    break
+            return response, rtt
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @property
+    def max_varbinds(self) -> int:
+        """Return the learned number of variable bindings per request."""
+        return self._max_varbinds.value
+
+    @property
+    def address(self) -> str | None:
+        """Return the resolved IP address of the device."""
+        target = getattr(self, "_target", None)
+        return None if target is None else target.transport_address[0]
+
+    async def get(self, oids, priority: RequestPriority = RequestPriority.POLL) -> dict:
+        """Get data for given OIDs, skipping OIDs known to be unsupported.
+
+        The OIDs are split into as few requests as the device accepts.
+        """
+        now = time.monotonic()
+        return await self._get_batches(
+            [oid for oid in oids if self._unsupported.get(oid, 0) <= now], priority
+        )
 
-            items = {}
-            for var_bind in var_binds:
-                items[str(var_bind[0])] = __class__.cast(var_bind[1])
-            return items
+    async def _get_batches(self, oids: list[str], priority: RequestPriority) -> dict:
+        """Get data for given OIDs in batches of the learned request size."""
+        size = self._max_varbinds.value
+        if len(oids) <= size:
+            return await self._get(oids, priority) if oids else {}
+
+        items = {}
+        for result in await asyncio.gather(
+            *(
+                self._get(oids[start : start + size], priority)
+                for start in range(0, len(oids), size)
+            )
+        ):
+            items.update(result)
+        return items
+
+    async def _get(
+        self, oids: list[str], priority: RequestPriority, retried: bool = False
+    ) -> dict:
+        """Get data for given OIDs and isolate unsupported ones.
+
+        Without the OID reported as failing, the batch is retried once as is
+        and only split if it fails again.
+        """
+        _LOGGER.debug("Get OID(s) %s", oids)
+
+        (
+            error_indication,
+            error_status,
+            error_index,
+            var_binds,
+        ) = await self._request(
+            hlapi.get_cmd,
+            self._credentials,
+            *self.registry.object_types(oids),
+            priority=priority,
+        )
+
+        if (
+            not error_indication
+            and error_status == ERROR_STATUS_TOO_BIG
+            and len(oids) > 1
+        ):
+            self._reduce_max_varbinds(self._max_varbinds, len(oids) * 3 // 4)
+            self.stats.retries += 1
+            return await self._get_batches(oids, priority)
+
+        if error_index:
+            self._add_unsupported(oids[error_index - 1])
+            oids = oids[: error_index - 1] + oids[error_index:]
+            self.stats.retries += 1
+            if not oids:
+                return {}
+            if len(oids) < 2 or not retried:
+                return await self._get(oids, priority, retried=True)
+
+            # Agents only report the first failing OID. Retrying both halves at
+            # once isolates further failures in logarithmic instead of linear
+            # round trips.
+            return await self._get_split(oids, priority)
+
+        if error_indication or error_status:
+            raise RuntimeError(
+                f"Got SNMP error: {error_indication} {error_status} {error_index}"
+            )
 
-        return {}
+        self._raise_max_varbinds(self._max_varbinds, len(oids))
+        start = time.perf_counter()
+        items = {}
+        for var_bind in var_binds:
+            if isinstance(var_bind[1], (NoSuchInstance, NoSuchObject)):
+                self._add_unsupported(str(var_bind[0]))
+                continue
+            items[str(var_bind[0])] = __class__.decode(var_bind[1])
+        self.stats.add_decode_time(time.perf_counter() - start)
+        return items
+
+    async def _get_split(self, oids: list[str], priority: RequestPriority) -> dict:
+        """Get data for both halves of the given OIDs concurrently."""
+        half = len(oids) // 2
+        items = {}
+        for result in await asyncio.gather(
+            self._get(oids[:half], priority), self._get(oids[half:], priority)
+        ):
+            items.update(result)
+        return items
+
+    def _reduce_max_varbinds(self, limit: VarBindLimit, max_varbinds: int) -> None:
+        """Lower the number of variable bindings per request."""
+        if limit.reduce(max_varbinds):
+            _LOGGER.debug("Reduce max varbinds to %d", limit.value)
+
+    def _raise_max_varbinds(self, limit: VarBindLimit, varbinds: int) -> None:
+        """Count a successful request, trying more variable bindings after some."""
+        if limit.succeed(varbinds):
+            _LOGGER.debug("Try max varbinds of %d", limit.value)
+
+    def _add_unsupported(self, oid: str) -> None:
+        """Remember an OID the device does not support."""
+        _LOGGER.debug("Skip unsupported OID %s for %ss", oid, UNSUPPORTED_OID_TTL)
+        self._unsupported[oid] = time.monotonic() + UNSUPPORTED_OID_TTL
+        self.stats.removed_oids += 1
+
+    def set_firmware(self, firmware: str) -> None:
+        """Set the firmware version and forget unsupported OIDs if it changed."""
+        if firmware != self._firmware:
+            self._firmware = firmware
+            self._unsupported.clear()
+
+    def get_profile(self) -> dict:
+        """Return the learned capabilities of the device."""
+        now = time.monotonic()
+        return {
+            "max_varbinds": self._max_varbinds.value,
+            "max_bulk_varbinds": self._max_bulk_varbinds.value,
+            "unsupported": sorted(
+                oid for oid, expires in self._unsupported.items() if expires > now
+            ),
+        }
+
+    def restore_profile(self, profile: dict) -> None:
+        """Restore capabilities learned in a previous run."""
+        expires = time.monotonic() + UNSUPPORTED_OID_TTL
+        max_varbinds = profile.get("max_varbinds", SNMP_MAX_VARBINDS_DEFAULT)
+        self._max_varbinds.value = max_varbinds
+        self._max_bulk_varbinds.value = profile.get("max_bulk_varbinds", max_varbinds)
+        self._unsupported = dict.fromkeys(profile.get("unsupported", ()), expires)
 
     async def set(self, oid: str, value, value_type: str = "OctetString") -> bool:
         """Set SNMP value for the given OID.
@@ -182,12 +562,24 @@ class SnmpApi:
         Returns:
             True if set succeeded, otherwise raises RuntimeError.
         """
+        return await self.set_many({oid: value}, value_type)
+
+    async def set_many(self, values: dict, value_type: str = "OctetString") -> bool:
+        """Set SNMP values of the same type with as few requests as possible.
+
+        Args:
+            values: Mapping of OID strings to the values to set.
+            value_type: Type of the SNMP values as string ("OctetString", "Integer")
+
+        Returns:
+            True if all sets succeeded, otherwise raises RuntimeError.
+        """
 
-        # Map value_type string to pysnmp type instance
+        # Map value_type string to pysnmp type
         if value_type == "OctetString":
-            snmp_value = OctetString(value)
+            snmp_type = OctetString
         elif value_type == "Integer":
-            snmp_value = Integer(value)
+            snmp_type = Integer
         else:
             raise ValueError(f"Unsupported SNMP type: {value_type}")
 
@@ -196,84 +588,156 @@ class SnmpApi:
         if self._credentials_write is not None:
             credentials = self._credentials_write
 
-        error_indication, error_status, error_index, var_binds = await hlapi.set_cmd(
-            self._snmpEngine,
-            credentials,
-            self._target,
-            hlapi.ContextData(),
-            hlapi.ObjectType(hlapi.ObjectIdentity(oid), snmp_value),
-        )
+        object_types = [
+            hlapi.ObjectType(hlapi.ObjectIdentity(oid), snmp_type(value))
+            for oid, value in values.items()
+        ]
+        size = self._max_varbinds.value
+        for start in range(0, len(object_types), size):
+            (
+                error_indication,
+                error_status,
+                error_index,
+                _var_binds,
+            ) = await self._request(
+                hlapi.set_cmd,
+                credentials,
+                *object_types[start : start + size],
+                priority=RequestPriority.CONTROL,
+            )
 
-        if error_indication:
-            raise RuntimeError(f"SNMP set error: {error_indication}")
-        if error_status:
-            raise RuntimeError(
-                f"SNMP set error at {error_index} - {error_status.prettyPrint()}"
+            if error_indication:
+                raise RuntimeError(f"SNMP set error: {error_indication}")
+            if error_status:
+                raise RuntimeError(
+                    f"SNMP set error at {error_index} - {error_status.prettyPrint()}"
+                )
+            self._raise_max_varbinds(
+                self._max_varbinds, len(object_types[start : start + size])
             )
         return True
 
-    async def get_bulk(
-        self,
-        oids,
-        count,
-        start_from=1,
-    ) -> list:
-        """Get table data for given OIDs with defined rown count."""
-        _LOGGER.debug("Get %s bulk OID(s) %s", count, oids)
-        result = []
-        var_binds = __class__.construct_object_types(oids)
-        for _i in range(count):
+    async def get_table(self, columns: dict[str, int]) -> dict:
+        """Walk the given table columns with as few GETBULK requests as possible.
+
+        Args:
+            columns: Mapping of column OID prefixes to their expected row count.
+                A row count of 0 walks the column until its end.
+
+        Returns:
+            Dict with all OIDs found within the given columns and their values.
+        """
+        cursors = {prefix: prefix for prefix in columns}
+        remaining = {
+            prefix: count if count > 0 else None for prefix, count in columns.items()
+        }
+
+        items = {}
+        while cursors:
+            # Columns with a single outstanding row are sent as non-repeaters,
+            # so small tables do not spill over into the following ones.
+            non_repeaters = [prefix for prefix in cursors if remaining[prefix] == 1]
+            repeaters = [prefix for prefix in cursors if remaining[prefix] != 1]
+            # Ask for as many rows as the response can hold.
+            limit = max(
+                (self._max_bulk_varbinds.value - len(non_repeaters))
+                // max(len(repeaters), 1),
+                1,
+            )
+            max_repetitions = min(
+                max((remaining[prefix] or limit for prefix in repeaters), default=1),
+                limit,
+            )
+            order = non_repeaters + repeaters
+
+            _LOGGER.debug(
+                "Get bulk OID(s) %s with %d repetitions", order, max_repetitions
+            )
+
             (
                 error_indication,
                 error_status,
                 error_index,
-                var_bind_table,
-            ) = await hlapi.bulk_cmd(
-                self._snmpEngine,
+                var_binds,
+            ) = await self._request(
+                hlapi.bulk_cmd,
                 self._credentials,
-                self._target,
-                hlapi.ContextData(),
-                start_from,
-                count,
-                *var_binds,
+                len(non_repeaters),
+                max_repetitions,
+                *self.registry.object_types([cursors[p] for p in order]),
+                lookupMib=False,
             )
 
-            if not error_indication and not error_indication:
-                items = {}
-                for var_bind in var_bind_table:
-                    items[str(var_bind[0])] = __class__.cast(var_bind[1])
-                result.append(items)
-            else:
+            if error_indication:
                 raise RuntimeError(
                     f"Got SNMP error: {error_indication} {error_status} {error_index}"
                 )
 
-            var_binds = var_bind_table
+            if error_status == ERROR_STATUS_TOO_BIG and max_repetitions > 1:
+                self._reduce_max_varbinds(
+                    self._max_bulk_varbinds,
+                    (len(non_repeaters) + max_repetitions * len(repeaters)) * 3 // 4,
+                )
+                self.stats.retries += 1
+                continue
 
-        return result
+            if error_status:
+                if error_index:
+                    # SNMPv1 agents report the end of the MIB view as an error.
+                    _LOGGER.debug("Remove error index %d", error_index - 1)
+                    del cursors[order[error_index - 1]]
+                    continue
+                raise RuntimeError(
+                    f"Got SNMP error: {error_indication} {error_status} {error_index}"
+                )
 
-    async def get_bulk_auto(
-        self,
-        oids,
-        count_oid,
-        start_from=1,
-    ) -> list:
-        """Get table data for given OIDs with determined rown count."""
-        return await self.get_bulk(
-            oids, await self.get([count_oid])[count_oid], start_from
-        )
+            start = time.perf_counter()
+            progress = False
+            end_of_mib = False
+            for position, var_bind in enumerate(var_binds):
+                if position < len(non_repeaters):
+                    prefix = non_repeaters[position]
+                else:
+                    prefix = repeaters[(position - len(non_repeaters)) % len(repeaters)]
+
+                if prefix not in cursors:
+                    continue
+
+                oid = str(var_bind[0])
+                if isinstance(var_bind[1], EndOfMibView):
+                    end_of_mib = True
+                    del cursors[prefix]
+                    continue
+                if not oid.startswith(prefix + ".") or oid == cursors[prefix]:
+                    del cursors[prefix]
+                    continue
+
+                items[oid] = __class__.decode(var_bind[1])
+                cursors[prefix] = oid
+                progress = True
+
+                if remaining[prefix] is not None:
+                    remaining[prefix] -= 1
+                    if remaining[prefix] <= 0:
+                        del cursors[prefix]
+            self.stats.add_decode_time(time.perf_counter() - start)
+
+            requested = len(non_repeaters) + max_repetitions * len(repeaters)
+            if repeaters and not end_of_mib and len(var_binds) < requested:
+                # The agent truncated the response, so we ask for less next time.
+                self._reduce_max_varbinds(self._max_bulk_varbinds, len(var_binds))
+            elif repeaters:
+                self._raise_max_varbinds(self._max_bulk_varbinds, requested)
+
+            if not progress:
+                break
+
+        return items
 
     @staticmethod
-    def cast(value):
-        """Cast returned value into correct type."""
-        try:
-            return int(value)
-        except (ValueError, TypeError):
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                try:
-                    return str(value)
-                except (ValueError, TypeError):
-                    pass
-        return value
+    def decode(value):
+        """Decode a pysnmp value into a native value by its type."""
+        decoder = _decoders.get(value.__class__)
+        if decoder is None:
+            decoder = _get_decoder(value.__class__)
+        return decoder(value)
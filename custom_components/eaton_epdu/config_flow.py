@@ -20,27 +20,65 @@ from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     ATTR_ACCURATE_POWER,
+    ATTR_ADAPTIVE_INTERVAL,
     ATTR_AUTH_KEY,
     ATTR_AUTH_KEY_WRITE,
     ATTR_AUTH_PROTOCOL,
     ATTR_AUTH_PROTOCOL_WRITE,
     ATTR_COMMUNITY,
     ATTR_COMMUNITY_WRITE,
+    ATTR_DEADBAND_CURRENT,
+    ATTR_DEADBAND_CURRENT_RELATIVE,
+    ATTR_DEADBAND_ENERGY,
+    ATTR_DEADBAND_ENERGY_RELATIVE,
+    ATTR_DEADBAND_POWER,
+    ATTR_DEADBAND_POWER_FACTOR,
+    ATTR_DEADBAND_POWER_FACTOR_RELATIVE,
+    ATTR_DEADBAND_POWER_RELATIVE,
+    ATTR_DEADBAND_VOLTAGE,
+    ATTR_DEADBAND_VOLTAGE_RELATIVE,
+    ATTR_HEDGE_REQUESTS,
     ATTR_HOST,
+    ATTR_INTERVAL_ENERGY,
+    ATTR_INTERVAL_POWER,
+    ATTR_INTERVAL_QUALITY,
+    ATTR_INTERVAL_STATUS,
+    ATTR_MAX_REQUESTS,
+    ATTR_MAX_SILENCE,
+    ATTR_MIN_WRITE_INTERVAL,
     ATTR_NAME,
     ATTR_PORT,
     ATTR_PRIV_KEY,
     ATTR_PRIV_KEY_WRITE,
     ATTR_PRIV_PROTOCOL,
     ATTR_PRIV_PROTOCOL_WRITE,
+    ATTR_RECEIVE_TRAPS,
+    ATTR_RECORD_TRACE,
+    ATTR_RESTORE_SNAPSHOT,
+    ATTR_RETRIES,
+    ATTR_TIMEOUT_MAX,
+    ATTR_TIMEOUT_MIN,
+    ATTR_TRAP_COMMUNITY,
+    ATTR_TRAP_PORT,
     ATTR_UPDATE_INTERVAL,
+    ATTR_UPDATE_INTERVAL_MAX,
+    ATTR_UPDATE_INTERVAL_MIN,
     ATTR_USERNAME,
     ATTR_USERNAME_WRITE,
     ATTR_VERSION,
     ATTR_VERSION_WRITE,
     DOMAIN,
+    MAX_REQUESTS_DEFAULT,
+    MAX_REQUESTS_GLOBAL_DEFAULT,
     SNMP_PORT_DEFAULT,
+    SNMP_RETRIES_DEFAULT,
+    SNMP_TIMEOUT_MAX_DEFAULT,
+    SNMP_TIMEOUT_MIN_DEFAULT,
+    SNMP_TRAP_COMMUNITY_DEFAULT,
+    SNMP_TRAP_PORT_DEFAULT,
     UPDATE_INTERVAL_DEFAULT,
+    UPDATE_INTERVAL_MAX_DEFAULT,
+    UPDATE_INTERVAL_MIN_DEFAULT,
     AuthProtocol,
     PrivProtocol,
     SnmpVersion,
@@ -61,9 +99,57 @@ def get_host_schema_config(data: ConfigType) -> Schema:
                 ATTR_UPDATE_INTERVAL,
                 default=data.get(ATTR_UPDATE_INTERVAL, UPDATE_INTERVAL_DEFAULT),
             ): cv.positive_int,
+            vol.Required(
+                ATTR_ADAPTIVE_INTERVAL, default=data.get(ATTR_ADAPTIVE_INTERVAL, False)
+            ): bool,
+            vol.Required(
+                ATTR_UPDATE_INTERVAL_MIN,
+                default=data.get(ATTR_UPDATE_INTERVAL_MIN, UPDATE_INTERVAL_MIN_DEFAULT),
+            ): cv.positive_int,
+            vol.Required(
+                ATTR_UPDATE_INTERVAL_MAX,
+                default=data.get(ATTR_UPDATE_INTERVAL_MAX, UPDATE_INTERVAL_MAX_DEFAULT),
+            ): cv.positive_int,
+            vol.Required(
+                ATTR_MAX_REQUESTS,
+                default=data.get(ATTR_MAX_REQUESTS, MAX_REQUESTS_DEFAULT),
+            ): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=MAX_REQUESTS_GLOBAL_DEFAULT)
+            ),
+            vol.Required(
+                ATTR_TIMEOUT_MIN,
+                default=data.get(ATTR_TIMEOUT_MIN, SNMP_TIMEOUT_MIN_DEFAULT),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+            vol.Required(
+                ATTR_TIMEOUT_MAX,
+                default=data.get(ATTR_TIMEOUT_MAX, SNMP_TIMEOUT_MAX_DEFAULT),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+            vol.Required(
+                ATTR_RETRIES, default=data.get(ATTR_RETRIES, SNMP_RETRIES_DEFAULT)
+            ): cv.positive_int,
+            vol.Required(
+                ATTR_HEDGE_REQUESTS, default=data.get(ATTR_HEDGE_REQUESTS, False)
+            ): bool,
+            vol.Required(
+                ATTR_RECEIVE_TRAPS, default=data.get(ATTR_RECEIVE_TRAPS, False)
+            ): bool,
+            vol.Required(
+                ATTR_TRAP_PORT,
+                default=data.get(ATTR_TRAP_PORT, SNMP_TRAP_PORT_DEFAULT),
+            ): cv.port,
+            vol.Required(
+                ATTR_TRAP_COMMUNITY,
+                default=data.get(ATTR_TRAP_COMMUNITY, SNMP_TRAP_COMMUNITY_DEFAULT),
+            ): cv.string,
+            vol.Required(
+                ATTR_RESTORE_SNAPSHOT, default=data.get(ATTR_RESTORE_SNAPSHOT, False)
+            ): bool,
             vol.Required(
                 ATTR_ACCURATE_POWER, default=data.get(ATTR_ACCURATE_POWER, False)
             ): bool,
+            vol.Required(
+                ATTR_RECORD_TRACE, default=data.get(ATTR_RECORD_TRACE, False)
+            ): bool,
             vol.Required(
                 ATTR_VERSION, default=data.get(ATTR_VERSION) or SnmpVersion.V1
             ): SelectSelector(
@@ -97,9 +183,57 @@ def get_host_schema_options(data: ConfigType) -> Schema:
                 ATTR_UPDATE_INTERVAL,
                 default=data.get(ATTR_UPDATE_INTERVAL, UPDATE_INTERVAL_DEFAULT),
             ): cv.positive_int,
+            vol.Required(
+                ATTR_ADAPTIVE_INTERVAL, default=data.get(ATTR_ADAPTIVE_INTERVAL, False)
+            ): bool,
+            vol.Required(
+                ATTR_UPDATE_INTERVAL_MIN,
+                default=data.get(ATTR_UPDATE_INTERVAL_MIN, UPDATE_INTERVAL_MIN_DEFAULT),
+            ): cv.positive_int,
+            vol.Required(
+                ATTR_UPDATE_INTERVAL_MAX,
+                default=data.get(ATTR_UPDATE_INTERVAL_MAX, UPDATE_INTERVAL_MAX_DEFAULT),
+            ): cv.positive_int,
+            vol.Required(
+                ATTR_MAX_REQUESTS,
+                default=data.get(ATTR_MAX_REQUESTS, MAX_REQUESTS_DEFAULT),
+            ): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=MAX_REQUESTS_GLOBAL_DEFAULT)
+            ),
+            vol.Required(
+                ATTR_TIMEOUT_MIN,
+                default=data.get(ATTR_TIMEOUT_MIN, SNMP_TIMEOUT_MIN_DEFAULT),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+            vol.Required(
+                ATTR_TIMEOUT_MAX,
+                default=data.get(ATTR_TIMEOUT_MAX, SNMP_TIMEOUT_MAX_DEFAULT),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+            vol.Required(
+                ATTR_RETRIES, default=data.get(ATTR_RETRIES, SNMP_RETRIES_DEFAULT)
+            ): cv.positive_int,
+            vol.Required(
+                ATTR_HEDGE_REQUESTS, default=data.get(ATTR_HEDGE_REQUESTS, False)
+            ): bool,
+            vol.Required(
+                ATTR_RECEIVE_TRAPS, default=data.get(ATTR_RECEIVE_TRAPS, False)
+            ): bool,
+            vol.Required(
+                ATTR_TRAP_PORT,
+                default=data.get(ATTR_TRAP_PORT, SNMP_TRAP_PORT_DEFAULT),
+            ): cv.port,
+            vol.Required(
+                ATTR_TRAP_COMMUNITY,
+                default=data.get(ATTR_TRAP_COMMUNITY, SNMP_TRAP_COMMUNITY_DEFAULT),
+            ): cv.string,
+            vol.Required(
+                ATTR_RESTORE_SNAPSHOT, default=data.get(ATTR_RESTORE_SNAPSHOT, False)
+            ): bool,
             vol.Required(
                 ATTR_ACCURATE_POWER, default=data.get(ATTR_ACCURATE_POWER, False)
             ): bool,
+            vol.Required(
+                ATTR_RECORD_TRACE, default=data.get(ATTR_RECORD_TRACE, False)
+            ): bool,
             vol.Required(
                 ATTR_VERSION, default=data.get(ATTR_VERSION) or SnmpVersion.V1
             ): SelectSelector(
@@ -121,6 +255,62 @@ def get_host_schema_options(data: ConfigType) -> Schema:
     )
 
 
+def validate_host_input(host_input: ConfigType) -> dict[str, str]:
+    """Return the errors of the host step input by field."""
+    errors = {}
+    if host_input[ATTR_UPDATE_INTERVAL_MIN] > host_input[ATTR_UPDATE_INTERVAL_MAX]:
+        errors[ATTR_UPDATE_INTERVAL_MAX] = "update_interval_range"
+    if host_input[ATTR_TIMEOUT_MIN] > host_input[ATTR_TIMEOUT_MAX]:
+        errors[ATTR_TIMEOUT_MAX] = "timeout_range"
+    return errors
+
+
+def get_intervals_schema(data: ConfigType) -> Schema:
+    """Return the metric group intervals schema for options flow."""
+    return vol.Schema(
+        {
+            vol.Required(key, default=data.get(key, 0)): cv.positive_int
+            for key in (
+                ATTR_INTERVAL_STATUS,
+                ATTR_INTERVAL_POWER,
+                ATTR_INTERVAL_QUALITY,
+                ATTR_INTERVAL_ENERGY,
+            )
+        }
+    )
+
+
+def get_filter_schema(data: ConfigType) -> Schema:
+    """Return the sensor filter schema for options flow."""
+    return vol.Schema(
+        {
+            **{
+                vol.Required(key, default=data.get(key, 0.0)): vol.All(
+                    vol.Coerce(float), vol.Range(min=0)
+                )
+                for key in (
+                    ATTR_DEADBAND_CURRENT,
+                    ATTR_DEADBAND_CURRENT_RELATIVE,
+                    ATTR_DEADBAND_VOLTAGE,
+                    ATTR_DEADBAND_VOLTAGE_RELATIVE,
+                    ATTR_DEADBAND_POWER_FACTOR,
+                    ATTR_DEADBAND_POWER_FACTOR_RELATIVE,
+                    ATTR_DEADBAND_POWER,
+                    ATTR_DEADBAND_POWER_RELATIVE,
+                    ATTR_DEADBAND_ENERGY,
+                    ATTR_DEADBAND_ENERGY_RELATIVE,
+                )
+            },
+            vol.Required(
+                ATTR_MIN_WRITE_INTERVAL, default=data.get(ATTR_MIN_WRITE_INTERVAL, 0)
+            ): cv.positive_int,
+            vol.Required(
+                ATTR_MAX_SILENCE, default=data.get(ATTR_MAX_SILENCE, 0)
+            ): cv.positive_int,
+        }
+    )
+
+
 def get_v1_schema(data: ConfigType) -> Schema:
     """Return the v1 schema."""
     return vol.Schema(
@@ -216,17 +406,21 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_host(self, host_input: ConfigType | None = None) -> FlowResult:
         """Handle the host step."""
+        errors = {}
         if host_input is not None:
             self.data = host_input
+            errors = validate_host_input(host_input)
 
-            if host_input[ATTR_VERSION] == SnmpVersion.V1:
+            if not errors and host_input[ATTR_VERSION] == SnmpVersion.V1:
                 return await self.async_step_v1()
 
-            if host_input[ATTR_VERSION] == SnmpVersion.V3:
+            if not errors and host_input[ATTR_VERSION] == SnmpVersion.V3:
                 return await self.async_step_v3()
 
         return self.async_show_form(
-            step_id="host", data_schema=get_host_schema_config(data=self.data)
+            step_id="host",
+            data_schema=get_host_schema_config(data=self.data),
+            errors=errors,
         )
 
     async def async_step_v1(self, v1_input: ConfigType | None = None) -> FlowResult:
@@ -311,9 +505,12 @@ class OptionsFlow(OptionsFlowWithReload):
 
     async def async_step_host(self, host_input: ConfigType | None = None) -> FlowResult:
         """Handle the host step."""
+        errors = {}
         if host_input is not None:
             self.data.update(host_input)
+            errors = validate_host_input(host_input)
 
+        if host_input is not None and not errors:
             if host_input[ATTR_VERSION_WRITE] == "None":
                 self.data.pop(ATTR_VERSION_WRITE, None)
                 self.data.pop(ATTR_COMMUNITY_WRITE, None)
@@ -323,16 +520,43 @@ class OptionsFlow(OptionsFlowWithReload):
                 self.data.pop(ATTR_PRIV_KEY_WRITE, None)
                 self.data.pop(ATTR_PRIV_PROTOCOL_WRITE, None)
 
-            if host_input[ATTR_VERSION] == SnmpVersion.V1:
-                return await self.async_step_v1()
-
-            if host_input[ATTR_VERSION] == SnmpVersion.V3:
-                return await self.async_step_v3()
+            return await self.async_step_intervals()
 
         return self.async_show_form(
-            step_id="host", data_schema=get_host_schema_options(data=self.data)
+            step_id="host",
+            data_schema=get_host_schema_options(data=self.data),
+            errors=errors,
         )
 
+    async def async_step_intervals(
+        self, intervals_input: ConfigType | None = None
+    ) -> FlowResult:
+        """Handle the metric group intervals step."""
+        if intervals_input is None:
+            return self.async_show_form(
+                step_id="intervals", data_schema=get_intervals_schema(self.data)
+            )
+
+        self.data.update(intervals_input)
+
+        return await self.async_step_filter()
+
+    async def async_step_filter(
+        self, filter_input: ConfigType | None = None
+    ) -> FlowResult:
+        """Handle the sensor filter step."""
+        if filter_input is None:
+            return self.async_show_form(
+                step_id="filter", data_schema=get_filter_schema(self.data)
+            )
+
+        self.data.update(filter_input)
+
+        if self.data[ATTR_VERSION] == SnmpVersion.V1:
+            return await self.async_step_v1()
+
+        return await self.async_step_v3()
+
     async def async_step_v1(self, v1_input: ConfigType | None = None) -> FlowResult:
         """Handle the v1 step."""
         if v1_input is None:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 
 from homeassistant.const import Platform
 
@@ -30,9 +30,76 @@ ATTR_PRIV_PROTOCOL_WRITE = "priv_protocol_write"
 ATTR_PRIV_KEY = "priv_key"
 ATTR_PRIV_KEY_WRITE = "priv_key_write"
 ATTR_UPDATE_INTERVAL = "update_interval"
+ATTR_UPDATE_INTERVAL_MIN = "update_interval_min"
+ATTR_UPDATE_INTERVAL_MAX = "update_interval_max"
+ATTR_ADAPTIVE_INTERVAL = "adaptive_interval"
+ATTR_INTERVAL_STATUS = "interval_status"
+ATTR_INTERVAL_POWER = "interval_power"
+ATTR_INTERVAL_QUALITY = "interval_quality"
+ATTR_INTERVAL_ENERGY = "interval_energy"
 ATTR_ACCURATE_POWER = "accurate_power"
+ATTR_MAX_REQUESTS = "max_requests"
+ATTR_TIMEOUT_MIN = "timeout_min"
+ATTR_TIMEOUT_MAX = "timeout_max"
+ATTR_RETRIES = "retries"
+ATTR_HEDGE_REQUESTS = "hedge_requests"
+ATTR_RECEIVE_TRAPS = "receive_traps"
+ATTR_TRAP_PORT = "trap_port"
+ATTR_TRAP_COMMUNITY = "trap_community"
+ATTR_DEADBAND_CURRENT = "deadband_current"
+ATTR_DEADBAND_CURRENT_RELATIVE = "deadband_current_relative"
+ATTR_DEADBAND_VOLTAGE = "deadband_voltage"
+ATTR_DEADBAND_VOLTAGE_RELATIVE = "deadband_voltage_relative"
+ATTR_DEADBAND_POWER_FACTOR = "deadband_power_factor"
+ATTR_DEADBAND_POWER_FACTOR_RELATIVE = "deadband_power_factor_relative"
+ATTR_DEADBAND_POWER = "deadband_power"
+ATTR_DEADBAND_POWER_RELATIVE = "deadband_power_relative"
+ATTR_DEADBAND_ENERGY = "deadband_energy"
+ATTR_DEADBAND_ENERGY_RELATIVE = "deadband_energy_relative"
+ATTR_MIN_WRITE_INTERVAL = "min_write_interval"
+ATTR_MAX_SILENCE = "max_silence"
+ATTR_RESTORE_SNAPSHOT = "restore_snapshot"
+ATTR_RECORD_TRACE = "record_trace"
+ATTR_STALE = "stale"
+ATTR_STATE = "state"
+ATTR_DELAY = "delay"
+
+SERVICE_SET_OUTLETS = "set_outlets"
+
+EVENT_NOTIFICATION = f"{DOMAIN}_notification"
+
+# Trap receivers shared by all config entries, by their UDP port.
+DATA_TRAP_RECEIVERS = f"{DOMAIN}_trap_receivers"
 
 UPDATE_INTERVAL_DEFAULT = 60
+UPDATE_INTERVAL_MIN_DEFAULT = 10
+UPDATE_INTERVAL_MAX_DEFAULT = 300
+METADATA_UPDATE_INTERVAL_DEFAULT = 3600
+MAX_REQUESTS_DEFAULT = 2
+MAX_REQUESTS_GLOBAL_DEFAULT = 16
+
+# Version of the stored device profile and seconds to delay writing it.
+PROFILE_STORAGE_VERSION = 1
+PROFILE_SAVE_DELAY = 10
+# Seconds the device uptime may lag behind the wall clock time since the
+# profile was saved, before the device is taken as restarted.
+PROFILE_UPTIME_TOLERANCE = 60
+SNAPSHOT_SAVE_INTERVAL = 300
+
+# Seconds until the first read of a switched outlet, the longest delay between
+# two reads and the time to wait for the outlet to confirm its new state.
+SWITCH_READ_BACK_DELAY = 0.5
+SWITCH_READ_BACK_DELAY_MAX = 2.0
+SWITCH_READ_BACK_TIMEOUT = 15
+
+# Polls kept with their requests for the diagnostics.
+DIAGNOSTICS_POLLS = 10
+
+# Weight of the latest relative power change in the rolling volatility and the
+# volatility thresholds to poll faster or slower in adaptive mode.
+ADAPTIVE_SMOOTHING = 0.3
+ADAPTIVE_VOLATILITY_HIGH = 0.05
+ADAPTIVE_VOLATILITY_LOW = 0.01
 
 
 class SnmpVersion(StrEnum):
@@ -50,6 +117,22 @@ class SnmpVersionWrite(StrEnum):
     V3 = "3"
 
 
+class RequestPriority(IntEnum):
+    """Enum with request priorities, lower values are sent first."""
+
+    CONTROL = 0
+    POLL = 1
+
+
+class MetricGroup(StrEnum):
+    """Enum with groups of metrics polled at the same rate."""
+
+    STATUS = "status"
+    POWER = "power"
+    QUALITY = "quality"
+    ENERGY = "energy"
+
+
 class AuthProtocol(StrEnum):
     """Enum with snmp auth protocol options."""
 
@@ -78,6 +161,29 @@ class PrivProtocol(StrEnum):
 SNMP_API_CLIENT = "snmp_api_client"
 
 SNMP_PORT_DEFAULT = 161
+SNMP_TRAP_PORT_DEFAULT = 162
+SNMP_TRAP_COMMUNITY_DEFAULT = "public"
+
+# Bounds in seconds of the timeout derived from the round trip times, the
+# timeout until the first round trip was measured and the retries after it.
+SNMP_TIMEOUT_MIN_DEFAULT = 0.5
+SNMP_TIMEOUT_MAX_DEFAULT = 10.0
+SNMP_TIMEOUT_INITIAL = 1.0
+SNMP_RETRIES_DEFAULT = 3
+
+# Round trips to measure before a read is sent again while still unanswered.
+HEDGE_MIN_SAMPLES = 20
+
+# Variable bindings per request and response until the device limit is learned.
+SNMP_MAX_VARBINDS_DEFAULT = 256
+
+# Seconds to skip an OID the device reported as unsupported.
+UNSUPPORTED_OID_TTL = 86400
+
+SNMP_OID_SYSTEM_UPTIME = "1.3.6.1.2.1.1.3.0"
+SNMP_OID_TRAP = "1.3.6.1.6.3.1.1.4.1.0"
+SNMP_OID_TRAP_COLD_START = "1.3.6.1.6.3.1.1.5.1"
+SNMP_OID_TRAP_WARM_START = "1.3.6.1.6.3.1.1.5.2"
 
 # https://mibs.observium.org/mib/EATON-EPDU-MIB/
 
@@ -90,6 +196,12 @@ SNMP_OID_UNITS_DEVICE_NAME = "1.3.6.1.4.1.534.6.6.7.1.2.1.6.unit"
 SNMP_OID_UNITS_INPUT_COUNT = "1.3.6.1.4.1.534.6.6.7.1.2.1.20.unit"
 SNMP_OID_UNITS_OUTLET_COUNT = "1.3.6.1.4.1.534.6.6.7.1.2.1.22.unit"
 
+# Subtrees of the input and outlet tables and the position of the unit arc in
+# their OIDs.
+SNMP_OID_INPUTS = "1.3.6.1.4.1.534.6.6.7.3."
+SNMP_OID_OUTLETS = "1.3.6.1.4.1.534.6.6.7.6."
+SNMP_OID_TABLE_UNIT_ARC = 14
+
 SNMP_OID_INPUTS_FEED_NAME = "1.3.6.1.4.1.534.6.6.7.3.1.1.10.unit.index"
 SNMP_OID_INPUTS_VOLTAGE = "1.3.6.1.4.1.534.6.6.7.3.2.1.3.unit.1.index"
 SNMP_OID_INPUTS_CURRENT = "1.3.6.1.4.1.534.6.6.7.3.3.1.4.unit.1.index"
@@ -108,3 +220,7 @@ SNMP_OID_OUTLETS_WATT_HOURS = "1.3.6.1.4.1.534.6.6.7.6.5.1.4.unit.index"
 SNMP_OID_OUTLETS_STATUS = "1.3.6.1.4.1.534.6.6.7.6.6.1.2.unit.index"
 SNMP_OID_OUTLETS_SWITCH_ON = "1.3.6.1.4.1.534.6.6.7.6.6.1.4.unit.index"
 SNMP_OID_OUTLETS_SWITCH_OFF = "1.3.6.1.4.1.534.6.6.7.6.6.1.3.unit.index"
+
+# Values of outletControlStatus once an outlet has been switched.
+OUTLET_STATUS_OFF = 0
+OUTLET_STATUS_ON = 1
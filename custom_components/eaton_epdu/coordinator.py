@@ -2,29 +2,67 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+import json
 import logging
+import time
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import SnmpApi
 from .const import (
+    ADAPTIVE_SMOOTHING,
+    ADAPTIVE_VOLATILITY_HIGH,
+    ADAPTIVE_VOLATILITY_LOW,
+    ATTR_ADAPTIVE_INTERVAL,
+    ATTR_INTERVAL_ENERGY,
+    ATTR_INTERVAL_POWER,
+    ATTR_INTERVAL_QUALITY,
+    ATTR_INTERVAL_STATUS,
+    ATTR_RESTORE_SNAPSHOT,
     ATTR_UPDATE_INTERVAL,
+    ATTR_UPDATE_INTERVAL_MAX,
+    ATTR_UPDATE_INTERVAL_MIN,
+    DIAGNOSTICS_POLLS,
     DOMAIN,
+    EVENT_NOTIFICATION,
+    MANUFACTURER,
+    METADATA_UPDATE_INTERVAL_DEFAULT,
+    OUTLET_STATUS_OFF,
+    OUTLET_STATUS_ON,
+    PROFILE_SAVE_DELAY,
+    PROFILE_STORAGE_VERSION,
+    PROFILE_UPTIME_TOLERANCE,
+    SNAPSHOT_SAVE_INTERVAL,
+    SNMP_OID_INPUTS,
     SNMP_OID_INPUTS_CURRENT,
     SNMP_OID_INPUTS_FEED_NAME,
     SNMP_OID_INPUTS_PF,
     SNMP_OID_INPUTS_VOLTAGE,
     SNMP_OID_INPUTS_WATT_HOURS,
     SNMP_OID_INPUTS_WATTS,
+    SNMP_OID_OUTLETS,
     SNMP_OID_OUTLETS_CURRENT,
     SNMP_OID_OUTLETS_DESIGNATOR,
     SNMP_OID_OUTLETS_PF,
     SNMP_OID_OUTLETS_STATUS,
+    SNMP_OID_OUTLETS_SWITCH_OFF,
+    SNMP_OID_OUTLETS_SWITCH_ON,
     SNMP_OID_OUTLETS_WATT_HOURS,
     SNMP_OID_OUTLETS_WATTS,
+    SNMP_OID_SYSTEM_UPTIME,
+    SNMP_OID_TABLE_UNIT_ARC,
+    SNMP_OID_TRAP_COLD_START,
+    SNMP_OID_TRAP_WARM_START,
     SNMP_OID_UNITS,
     SNMP_OID_UNITS_DEVICE_NAME,
     SNMP_OID_UNITS_FIRMWARE_VERSION,
@@ -33,140 +71,922 @@ from .const import (
     SNMP_OID_UNITS_PART_NUMBER,
     SNMP_OID_UNITS_PRODUCT_NAME,
     SNMP_OID_UNITS_SERIAL_NUMBER,
+    SWITCH_READ_BACK_DELAY,
+    SWITCH_READ_BACK_DELAY_MAX,
+    SWITCH_READ_BACK_TIMEOUT,
     UPDATE_INTERVAL_DEFAULT,
+    UPDATE_INTERVAL_MAX_DEFAULT,
+    UPDATE_INTERVAL_MIN_DEFAULT,
+    MetricGroup,
+    RequestPriority,
 )
+from .scheduler import PollScheduler
+from .store import MeasurementStore
+
+INPUT_COLUMNS = {
+    SNMP_OID_INPUTS_CURRENT: MetricGroup.POWER,
+    SNMP_OID_INPUTS_PF: MetricGroup.QUALITY,
+    SNMP_OID_INPUTS_VOLTAGE: MetricGroup.QUALITY,
+    SNMP_OID_INPUTS_WATTS: MetricGroup.POWER,
+    SNMP_OID_INPUTS_WATT_HOURS: MetricGroup.ENERGY,
+}
+
+OUTLET_COLUMNS = {
+    SNMP_OID_OUTLETS_CURRENT: MetricGroup.POWER,
+    SNMP_OID_OUTLETS_PF: MetricGroup.QUALITY,
+    SNMP_OID_OUTLETS_WATTS: MetricGroup.POWER,
+    SNMP_OID_OUTLETS_WATT_HOURS: MetricGroup.ENERGY,
+    SNMP_OID_OUTLETS_STATUS: MetricGroup.STATUS,
+}
+
+GROUP_INTERVALS = {
+    MetricGroup.STATUS: ATTR_INTERVAL_STATUS,
+    MetricGroup.POWER: ATTR_INTERVAL_POWER,
+    MetricGroup.QUALITY: ATTR_INTERVAL_QUALITY,
+    MetricGroup.ENERGY: ATTR_INTERVAL_ENERGY,
+}
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class SnmpCoordinator(DataUpdateCoordinator):
+def get_profile_store(hass: HomeAssistant, entry_id: str) -> Store[dict]:
+    """Return the store of the device profile of a config entry."""
+    return Store(hass, PROFILE_STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+def parse_units(units) -> list[str]:
+    """Parse the list of units."""
+    if units is None:
+        return []
+
+    if isinstance(units, str) and units.find(",") != -1:
+        return units.split(",")
+
+    return [str(units)]
+
+
+@dataclass(slots=True)
+class UnitDevice:
+    """Cached device context of a unit."""
+
+    identifier: str
+    info: DeviceInfo
+
+
+class SnmpCoordinator(DataUpdateCoordinator[MeasurementStore]):
     """Data update coordinator."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, api: SnmpApi) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api: SnmpApi,
+        scheduler: PollScheduler | None = None,
+    ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=entry,
             name=DOMAIN,
             update_interval=timedelta(
                 seconds=entry.data.get(ATTR_UPDATE_INTERVAL, UPDATE_INTERVAL_DEFAULT)
             ),
         )
         self._api = api
+        self._scheduler = scheduler
+        self._interval = self.update_interval.total_seconds()
+        self._next_poll: float | None = None
+        # The first poll is delayed by the phase to spread the polls of all entries.
+        self._phase_offset = 0.0
+        if scheduler is not None:
+            self._phase_offset = scheduler.register(entry.entry_id) * self._interval
+        self.registry = api.registry
+        self._adaptive = entry.data.get(ATTR_ADAPTIVE_INTERVAL, False)
+        self._interval_min = entry.data.get(
+            ATTR_UPDATE_INTERVAL_MIN, UPDATE_INTERVAL_MIN_DEFAULT
+        )
+        self._interval_max = entry.data.get(
+            ATTR_UPDATE_INTERVAL_MAX, UPDATE_INTERVAL_MAX_DEFAULT
+        )
+        self._power: float | None = None
+        self._volatility = 0.0
+        self._changed: set[str] | None = None
+        self._key_listeners: dict[str, dict[CALLBACK_TYPE, None]] = {}
+        self._notified_success = False
+        self._devices: dict[str, UnitDevice] = {}
+        self._metadata: dict = {}
+        self._metadata_updated: float | None = None
+        self._tables: list[dict[str, int]] = []
+        self._groups: dict[str, MetricGroup] = {}
+        self._group_intervals = {
+            group: entry.data.get(attr, 0) for group, attr in GROUP_INTERVALS.items()
+        }
+        self._group_polled: dict[MetricGroup, float] = {}
+        self._units: list[str] | None = None
+        self._uptime: int | None = None
+        self._profile_store = get_profile_store(hass, entry.entry_id)
+        self._profile: dict | None = None
+        self._restore_snapshot = entry.data.get(ATTR_RESTORE_SNAPSHOT, False)
+        self._snapshot_saved: float | None = None
+        # Requested state of outlets with a command on its way, the result of
+        # the call sending it, and the status expected from the last command
+        # for each outlet status OID with the time polls take over again.
+        self._switching: dict[tuple[str, str], bool] = {}
+        self._switched: dict[tuple[str, str], asyncio.Future[None]] = {}
+        self._expected: dict[str, int] = {}
+        self._expected_until: dict[str, float] = {}
+        # OIDs to read for received notifications and whether a read runs.
+        self._notified: set[str] = set()
+        self._reading_notified = False
+        self.stale = False
+        self.statistics: dict[str, float | int | None] = {}
+        self._polls: deque[dict] = deque(maxlen=DIAGNOSTICS_POLLS)
 
-    async def _update_data(self) -> dict:
+    async def _update_data(self) -> MeasurementStore:
         """Fetch the latest data from the source."""
+        started = time.monotonic()
+        counters = self._api.stats.counters()
+        self._api.stats.log = []
+        success = False
+        lag = None
+        if self._next_poll is not None:
+            lag = max(started - self._next_poll, 0.0)
+            if self._scheduler is not None:
+                self._scheduler.report_lag(self.config_entry.entry_id, lag)
+
         try:
-            if self.data is None:
-                self.data = await self._api.get([SNMP_OID_UNITS])
-            else:
-                self.data.update(await self._api.get([SNMP_OID_UNITS]))
-
-            for unit in self.get_units():
-                self.data.update(
-                    await self._api.get(
-                        [
-                            SNMP_OID_UNITS_PRODUCT_NAME.replace("unit", unit),
-                            SNMP_OID_UNITS_PART_NUMBER.replace("unit", unit),
-                            SNMP_OID_UNITS_SERIAL_NUMBER.replace("unit", unit),
-                            SNMP_OID_UNITS_FIRMWARE_VERSION.replace("unit", unit),
-                            SNMP_OID_UNITS_DEVICE_NAME.replace("unit", unit),
-                            SNMP_OID_UNITS_INPUT_COUNT.replace("unit", unit),
-                            SNMP_OID_UNITS_OUTLET_COUNT.replace("unit", unit),
-                        ]
-                    )
-                )
+            refresh_metadata = self.data is None or self._metadata_expired()
+            if refresh_metadata and not await self._restore_profile():
+                await self._update_metadata()
 
-                input_count = self.data.get(
-                    SNMP_OID_UNITS_INPUT_COUNT.replace("unit", unit), 0
-                )
-                if input_count > 0:
-                    for result in await self._api.get_bulk(
-                        [
-                            SNMP_OID_INPUTS_FEED_NAME.replace("unit", unit).replace(
-                                "index", ""
-                            ),
-                            SNMP_OID_INPUTS_CURRENT.replace("unit", unit).replace(
-                                "index", ""
-                            ),
-                            SNMP_OID_INPUTS_PF.replace("unit", unit).replace(
-                                "index", ""
-                            ),
-                            SNMP_OID_INPUTS_VOLTAGE.replace("unit", unit).replace(
-                                "index", ""
-                            ),
-                            SNMP_OID_INPUTS_WATTS.replace("unit", unit).replace(
-                                "index", ""
-                            ),
-                            SNMP_OID_INPUTS_WATT_HOURS.replace("unit", unit).replace(
-                                "index", ""
-                            ),
-                        ],
-                        input_count,
-                    ):
-                        self.data.update(result)
-
-                outlet_count = self.data.get(
-                    SNMP_OID_UNITS_OUTLET_COUNT.replace("unit", unit), 0
+            due, tables = self._get_due_tables()
+            _LOGGER.debug("Poll metric groups %s", sorted(due))
+
+            # Results are merged in request order to keep the data deterministic.
+            # Outlets being switched keep their expected status until read back.
+            self._expire_expected()
+            changed = set()
+            for result in await asyncio.gather(
+                *(self._api.get_table(columns) for columns in tables)
+            ):
+                values = result
+                if self._expected:
+                    values = {
+                        oid: value
+                        for oid, value in result.items()
+                        if oid not in self._expected
+                    }
+                changed.update(self.data.update_changed(values))
+            self._changed = None if refresh_metadata else changed
+
+            now = time.monotonic()
+            for group in due:
+                self._group_polled[group] = now
+
+            uptime = self.data.get(SNMP_OID_SYSTEM_UPTIME)
+            if (
+                isinstance(uptime, int)
+                and self._uptime is not None
+                and uptime < self._uptime
+            ):
+                _LOGGER.debug("Device has been restarted, refresh metadata")
+                self._metadata_updated = None
+            self._uptime = uptime if isinstance(uptime, int) else None
+
+            if self._adaptive:
+                self._adapt_update_interval()
+
+            if self.stale:
+                # Every entity drops the stale mark, changed or not.
+                self.stale = False
+                self._changed = None
+            if self._restore_snapshot and (
+                self._snapshot_saved is None
+                or now - self._snapshot_saved >= SNAPSHOT_SAVE_INTERVAL
+            ):
+                self._snapshot_saved = now
+                self._profile_store.async_delay_save(
+                    self._get_profile, PROFILE_SAVE_DELAY
                 )
-                if outlet_count > 0:
-                    for result in await self._api.get_bulk(
-                        [
-                            SNMP_OID_OUTLETS_DESIGNATOR.replace("unit", unit).replace(
-                                "index", ""
-                            ),
-                            SNMP_OID_OUTLETS_CURRENT.replace("unit", unit).replace(
-                                "index", ""
-                            ),
-                            SNMP_OID_OUTLETS_PF.replace("unit", unit).replace(
-                                "index", ""
-                            ),
-                            SNMP_OID_OUTLETS_WATTS.replace("unit", unit).replace(
-                                "index", ""
-                            ),
-                            SNMP_OID_OUTLETS_WATT_HOURS.replace("unit", unit).replace(
-                                "index", ""
-                            ),
-                            SNMP_OID_OUTLETS_STATUS.replace("unit", unit).replace(
-                                "index", ""
-                            ),
-                        ],
-                        outlet_count,
-                    ):
-                        self.data.update(result)
 
+            success = True
             return self.data
 
         except RuntimeError as err:
+            self._changed = None
             raise UpdateFailed(err) from err
 
-    def get_units(self) -> dict:
-        """Get units as dict."""
-        units = self.data.get(SNMP_OID_UNITS)
+        finally:
+            self._schedule_next_poll()
+            self._update_statistics(started, counters, lag, success)
 
-        if units is None:
-            return []
+    def _update_statistics(
+        self,
+        started: float,
+        counters: dict[str, int],
+        lag: float | None,
+        success: bool,
+    ) -> None:
+        """Record the cost of the poll which started with the given counters."""
+        stats = self._api.stats
+        duration = time.monotonic() - started
+        self._polls.append(
+            {
+                "started": datetime.fromtimestamp(
+                    time.time() - duration, UTC
+                ).isoformat(),
+                "duration": round(duration * 1000, 3),
+                "success": success,
+                "requests": stats.log,
+            }
+        )
+        stats.log = None
+        statistics = {
+            f"poll_{name}": value - counters[name]
+            for name, value in stats.counters().items()
+        }
+        statistics["poll_duration"] = duration * 1000
+        statistics["poll_lag"] = None if lag is None else lag * 1000
+        statistics["timeouts"] = stats.timeouts
+        statistics["retries"] = stats.retries
+        statistics["timeout_retries"] = stats.timeout_retries
+        statistics["hedges"] = stats.hedges
+        statistics["timeout"] = self._api.rtt.timeout * 1000
+        statistics["removed_oids"] = stats.removed_oids
+        for percentile in (50, 95):
+            rtt = stats.rtt_percentile(percentile)
+            statistics[f"rtt_p{percentile}"] = None if rtt is None else rtt * 1000
+        statistics["max_varbinds"] = self._api.max_varbinds
+        self.statistics = statistics
 
-        if isinstance(units, str) and units.find(",") != -1:
-            units = units.split(",")
-        else:
-            units = [str(units)]
+    def _schedule_next_poll(self) -> None:
+        """Set the interval until the next poll including a pending phase offset."""
+        seconds = self._interval + self._phase_offset
+        self._phase_offset = 0.0
+        self._next_poll = time.monotonic() + seconds
+        if seconds != self.update_interval.total_seconds():
+            self.update_interval = timedelta(seconds=seconds)
+
+    def _adapt_update_interval(self) -> None:
+        """Poll faster while the load changes and back off while it is stable."""
+        power = 0
+        for unit in self._units or []:
+            column = self.data.column(self.registry.get(SNMP_OID_INPUTS_WATTS, unit))
+            if column is not None:
+                power += sum(column.values)
+
+        if self._power is not None:
+            change = abs(power - self._power) / max(self._power, 1)
+            self._volatility = (
+                ADAPTIVE_SMOOTHING * change
+                + (1 - ADAPTIVE_SMOOTHING) * self._volatility
+            )
+        self._power = power
+
+        seconds = self._interval
+        if self._volatility > ADAPTIVE_VOLATILITY_HIGH:
+            seconds = max(seconds / 2, self._interval_min)
+        elif self._volatility < ADAPTIVE_VOLATILITY_LOW:
+            seconds = min(seconds * 1.5, self._interval_max)
+
+        if seconds != self._interval:
+            _LOGGER.debug(
+                "Load volatility %.3f, change update interval to %.0fs",
+                self._volatility,
+                seconds,
+            )
+            self._interval = seconds
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates of the OIDs given as context."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        if context is None:
+            return remove_listener
+
+        for key in context:
+            self._key_listeners.setdefault(key, {})[update_callback] = None
+
+        @callback
+        def remove_key_listener() -> None:
+            """Remove update listener."""
+            remove_listener()
+            for key in context:
+                listeners = self._key_listeners.get(key)
+                if listeners is not None:
+                    listeners.pop(update_callback, None)
+                    if not listeners:
+                        del self._key_listeners[key]
+
+        return remove_key_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update only the listeners whose OIDs changed."""
+        if (
+            self._changed is None
+            or not self.last_update_success
+            or not self._notified_success
+        ):
+            self._notified_success = self.last_update_success
+            super().async_update_listeners()
+            return
+
+        update_callbacks = {}
+        for key in self._changed:
+            update_callbacks.update(self._key_listeners.get(key, {}))
+        for update_callback, context in list(self._listeners.values()):
+            if context is None:
+                update_callbacks[update_callback] = None
+
+        _LOGGER.debug(
+            "%d OID(s) changed, update %d listener(s)",
+            len(self._changed),
+            len(update_callbacks),
+        )
+        for update_callback in update_callbacks:
+            update_callback()
+
+    async def _update_metadata(self) -> None:
+        """Fetch units, their identity and the table labels."""
+        metadata = await self._api.get([SNMP_OID_UNITS])
+        units = parse_units(metadata.get(SNMP_OID_UNITS))
+
+        for result in await asyncio.gather(
+            *(
+                self._api.get(
+                    [
+                        self.registry.get(oid, unit)
+                        for oid in (
+                            SNMP_OID_UNITS_PRODUCT_NAME,
+                            SNMP_OID_UNITS_PART_NUMBER,
+                            SNMP_OID_UNITS_SERIAL_NUMBER,
+                            SNMP_OID_UNITS_FIRMWARE_VERSION,
+                            SNMP_OID_UNITS_DEVICE_NAME,
+                            SNMP_OID_UNITS_INPUT_COUNT,
+                            SNMP_OID_UNITS_OUTLET_COUNT,
+                        )
+                    ]
+                )
+                for unit in units
+            )
+        ):
+            metadata.update(result)
+
+        tables = []
+        for unit in units:
+            columns = self._get_columns(
+                metadata, unit, SNMP_OID_UNITS_INPUT_COUNT, (SNMP_OID_INPUTS_FEED_NAME,)
+            )
+            columns.update(
+                self._get_columns(
+                    metadata,
+                    unit,
+                    SNMP_OID_UNITS_OUTLET_COUNT,
+                    (SNMP_OID_OUTLETS_DESIGNATOR,),
+                )
+            )
+            if columns:
+                tables.append(columns)
+
+        for result in await asyncio.gather(
+            *(self._api.get_table(columns) for columns in tables)
+        ):
+            metadata.update(result)
+
+        self._apply_metadata(metadata, units)
+        self._profile_store.async_delay_save(self._get_profile, PROFILE_SAVE_DELAY)
+
+    def _apply_metadata(self, metadata: dict, units: list[str]) -> None:
+        """Store the metadata and rebuild the poll plan if it changed."""
+        if self.data is None or self._units != units:
+            # Start with an empty store to drop values of removed units.
+            self.data = MeasurementStore()
+        self.data.update(metadata)
+
+        firmware = [
+            metadata.get(self.registry.get(SNMP_OID_UNITS_FIRMWARE_VERSION, unit))
+            for unit in units
+        ]
+        self._api.set_firmware(",".join(map(str, firmware)))
+
+        if metadata != self._metadata:
+            _LOGGER.debug("Metadata changed, rebuild poll plan")
+            if self._units != units:
+                self.registry.clear()
+            self._devices.clear()
+            self._metadata = metadata
+            self._units = units
+            self._tables = self._get_tables(metadata, units)
+            self._groups = {
+                self.registry.get(oid, unit): group
+                for unit in units
+                for oid, group in (INPUT_COLUMNS | OUTLET_COLUMNS).items()
+            }
+            self._group_polled.clear()
+            self.data.set_columns(
+                {
+                    prefix: count
+                    for columns in self._tables
+                    for prefix, count in columns.items()
+                }
+            )
+
+        self._metadata_updated = time.monotonic()
+
+    async def async_load_profile(self) -> None:
+        """Load the device profile stored by a previous run."""
+        self._profile = await self._profile_store.async_load()
+
+    async def _restore_profile(self) -> bool:
+        """Restore the stored device profile if the device has not changed.
+
+        The uptime in hundredths of a second must have grown at least by the
+        time since the profile was saved, else the device was restarted.
+        """
+        profile, self._profile = self._profile, None
+        if not profile:
+            return False
+
+        units = profile["units"]
+        metadata = profile["metadata"]
+        oids = [SNMP_OID_UNITS] + [
+            self.registry.get(oid, unit)
+            for unit in units
+            for oid in (SNMP_OID_UNITS_SERIAL_NUMBER, SNMP_OID_UNITS_FIRMWARE_VERSION)
+        ]
+        current = await self._api.get([*oids, SNMP_OID_SYSTEM_UPTIME])
+        uptime = current.get(SNMP_OID_SYSTEM_UPTIME)
+        elapsed = time.time() - profile.get("saved", time.time())
+        elapsed = max(elapsed - PROFILE_UPTIME_TOLERANCE, 0)
+        if (
+            any(current.get(oid) != metadata.get(oid) for oid in oids)
+            or not isinstance(uptime, int)
+            or uptime < (profile["uptime"] or 0) + elapsed * 100
+        ):
+            _LOGGER.debug("Device has changed, discard stored profile")
+            return False
+
+        _LOGGER.debug("Restore stored profile of units %s", units)
+        self._apply_metadata(metadata, units)
+        self._api.restore_profile(profile["api"])
+        return True
+
+    @callback
+    def restore_snapshot(self) -> bool:
+        """Restore the values of the last run if enabled and stored.
 
-        return units
+        The stored profile is kept to be validated by the first poll.
+        """
+        profile = self._profile
+        if not self._restore_snapshot or not profile or not profile.get("snapshot"):
+            return False
 
-    async def _async_update_data(self) -> dict:
+        _LOGGER.debug("Restore stored snapshot of units %s", profile["units"])
+        self._apply_metadata(profile["metadata"], profile["units"])
+        self.data.update(profile["snapshot"])
+        self._metadata_updated = None
+        self.stale = True
+        return True
+
+    def _get_profile(self) -> dict:
+        """Return the device profile to store."""
+        return {
+            "units": self._units,
+            "metadata": self._metadata,
+            "uptime": self._uptime,
+            "saved": time.time(),
+            "api": self._api.get_profile(),
+            "snapshot": dict(self.data) if self._restore_snapshot else None,
+        }
+
+    def _get_tables(self, metadata: dict, units: list[str]) -> list[dict[str, int]]:
+        """Return the table columns of all metric groups."""
+        tables = []
+        for unit in units:
+            tables.append(
+                self._get_columns(
+                    metadata, unit, SNMP_OID_UNITS_INPUT_COUNT, tuple(INPUT_COLUMNS)
+                )
+            )
+            tables.append(
+                self._get_columns(
+                    metadata, unit, SNMP_OID_UNITS_OUTLET_COUNT, tuple(OUTLET_COLUMNS)
+                )
+            )
+        return [columns for columns in tables if columns]
+
+    def _get_due_tables(self) -> tuple[set[MetricGroup], list[dict[str, int]]]:
+        """Return the due metric groups and their merged table columns."""
+        now = time.monotonic()
+        tolerance = self._interval / 2
+        due = {
+            group
+            for group, interval in self._group_intervals.items()
+            if group not in self._group_polled
+            or now - self._group_polled[group] + tolerance >= interval
+        }
+
+        tables = []
+        for columns in self._tables:
+            due_columns = {
+                prefix: count
+                for prefix, count in columns.items()
+                if self._groups[prefix] in due
+            }
+            if due_columns:
+                tables.append(due_columns)
+
+        tables = tables or [{}]
+        tables[0][SNMP_OID_SYSTEM_UPTIME.removesuffix(".0")] = 1
+        return due, tables
+
+    def _get_columns(
+        self, metadata: dict, unit: str, count_oid: str, oids: tuple
+    ) -> dict[str, int]:
+        """Return the table columns of a unit with their expected row count."""
+        count = metadata.get(self.registry.get(count_oid, unit), 0)
+        if count <= 0:
+            return {}
+        return {self.registry.get(oid, unit): count for oid in oids}
+
+    def get_device(self, unit: str) -> UnitDevice:
+        """Return the cached device context of a unit."""
+        device = self._devices.get(unit)
+        if device is None:
+            product_name = self.get_unit_data(SNMP_OID_UNITS_PRODUCT_NAME, unit)
+            part_number = self.get_unit_data(SNMP_OID_UNITS_PART_NUMBER, unit)
+            serial_number = self.get_unit_data(SNMP_OID_UNITS_SERIAL_NUMBER, unit)
+            name = self.get_unit_data(SNMP_OID_UNITS_DEVICE_NAME, unit)
+
+            identifier = self.get_unit_data(
+                SNMP_OID_UNITS_SERIAL_NUMBER,
+                unit,
+                default=self.get_unit_data(
+                    SNMP_OID_UNITS_DEVICE_NAME,
+                    unit,
+                    default=self.get_unit_data(
+                        SNMP_OID_UNITS_PART_NUMBER, unit, default=product_name
+                    ),
+                ),
+            )
+            model = product_name
+            if name:
+                model = f"{part_number} {product_name}"
+            else:
+                name = part_number
+
+            device = UnitDevice(
+                identifier=identifier,
+                info=DeviceInfo(
+                    identifiers={(DOMAIN, identifier)},
+                    manufacturer=MANUFACTURER,
+                    model=model,
+                    name=name,
+                    serial_number=serial_number,
+                    sw_version=self.get_unit_data(
+                        SNMP_OID_UNITS_FIRMWARE_VERSION, unit
+                    ),
+                ),
+            )
+            self._devices[unit] = device
+        return device
+
+    def get_diagnostics(self) -> dict:
+        """Return the topology, the learned profile and the recent polls."""
+        units = self._units or []
+        data = dict(self.data or {})
+        return {
+            "topology": {
+                unit: {
+                    "product_name": self.get_unit_data(
+                        SNMP_OID_UNITS_PRODUCT_NAME, unit
+                    ),
+                    "part_number": self.get_unit_data(SNMP_OID_UNITS_PART_NUMBER, unit),
+                    "firmware_version": self.get_unit_data(
+                        SNMP_OID_UNITS_FIRMWARE_VERSION, unit
+                    ),
+                    "inputs": self.get_unit_data(SNMP_OID_UNITS_INPUT_COUNT, unit),
+                    "outlets": self.get_unit_data(SNMP_OID_UNITS_OUTLET_COUNT, unit),
+                }
+                for unit in units
+            },
+            "tables": self._tables,
+            "update_interval": self._interval,
+            "profile": self._api.get_profile(),
+            "statistics": self.statistics,
+            "polls": list(self._polls),
+            "data": {
+                "keys": len(data),
+                "bytes": len(json.dumps(data, default=str).encode()),
+            },
+        }
+
+    def get_unit_data(
+        self, metric: str, unit: str, index: str | None = None, default=None
+    ):
+        """Return the value of a metric for the given unit and index."""
+        return self.data.get(self.registry.get(metric, unit, index), default)
+
+    def _metadata_expired(self) -> bool:
+        """Return True if the metadata needs to be fetched again."""
+        return (
+            self._metadata_updated is None
+            or time.monotonic() - self._metadata_updated
+            >= METADATA_UPDATE_INTERVAL_DEFAULT
+        )
+
+    @property
+    def address(self) -> str | None:
+        """Return the IP address of the device."""
+        return self._api.address
+
+    def get_units(self) -> list[str]:
+        """Get units as list."""
+        if self._units is None:
+            return parse_units(self.data.get(SNMP_OID_UNITS))
+        return self._units
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled call and write the rest of a recorded trace."""
+        await super().async_shutdown()
+        if self._api.recorder is not None:
+            await self._api.recorder.async_flush()
+
+    async def _async_update_data(self) -> MeasurementStore:
         """Fetch the latest data from the source."""
         return await self._update_data()
 
-    async def set_snmp_value(
-        self, oid: str, value, value_type: str = "OctetString"
-    ) -> bool:
-        """Set SNMP value and refresh data."""
+    async def async_switch_outlet(self, unit: str, index: str, on: bool) -> None:
+        """Switch an outlet and show its new state until the device confirms it."""
+        await self.async_switch_outlets([(unit, index)], on)
+
+    async def async_switch_outlets(
+        self, outlets: list[tuple[str, str]], on: bool, delay: int = 0
+    ) -> None:
+        """Switch outlets and show their new state until the device confirms it.
+
+        All commands are sent in as few SET requests as possible. Outlets are
+        switched on one after another with the given delay in seconds, which
+        the device times itself. Only the status of the outlets is read back,
+        in the background, so the call returns once the device accepted the
+        commands. If a command fails, the status of the outlets is read again.
+
+        An outlet switched again while a command for it is on its way gets no
+        command of its own. Once that command is done, one final command
+        switches the outlet to the state requested last. Such a call returns
+        or fails with the call sending the commands.
+        """
+        status = OUTLET_STATUS_ON if on else OUTLET_STATUS_OFF
+        expected = {
+            self.registry.get(SNMP_OID_OUTLETS_STATUS, unit, index): status
+            for unit, index in outlets
+        }
+        self._expect(expected, SWITCH_READ_BACK_TIMEOUT)
+        self.async_set_values(expected)
+
+        # Outlets with a command on its way are left to the call sending it,
+        # whose result is awaited.
+        owned = [outlet for outlet in outlets if outlet not in self._switching]
+        others = {self._switched[outlet] for outlet in outlets if outlet not in owned}
+        loop = asyncio.get_running_loop()
+        results = {outlet: loop.create_future() for outlet in owned}
+        self._switching.update(dict.fromkeys(outlets, on))
+        self._switched.update(results)
+        batch = owned
+        sent = False
+        try:
+            while batch:
+                await self._async_send_switch(batch, on, delay)
+                on = not on
+                batch = [outlet for outlet in batch if self._switching[outlet] == on]
+                delay = 0
+        except Exception as err:
+            self._drop_expected(expected)
+            await self.async_request_refresh()
+            for result in results.values():
+                result.set_exception(err)
+                # Mark it retrieved, nobody may have switched the outlet again.
+                result.exception()
+            raise
+        else:
+            sent = True
+            for result in results.values():
+                result.set_result(None)
+        finally:
+            for outlet, result in results.items():
+                result.cancel()
+                del self._switching[outlet]
+                del self._switched[outlet]
+            if not sent:
+                # Cancelled, no read back waits for these outlets.
+                self._drop_expected(expected)
+
+        if others:
+            await asyncio.gather(*others)
+
+    def _expect(self, values: dict[str, int], seconds: float) -> None:
+        """Expect status values for the given seconds, skipped by polls."""
+        deadline = time.monotonic() + seconds
+        self._expected.update(values)
+        self._expected_until.update(dict.fromkeys(values, deadline))
+
+    def _drop_expected(self, oids) -> None:
+        """Stop expecting status values, so polls store them again."""
+        for oid in list(oids):
+            self._expected.pop(oid, None)
+            self._expected_until.pop(oid, None)
+
+    def _expire_expected(self) -> None:
+        """Stop expecting the status values whose time is up."""
+        now = time.monotonic()
+        self._drop_expected(
+            oid for oid, deadline in self._expected_until.items() if deadline <= now
+        )
+
+    async def _async_send_switch(
+        self, outlets: list[tuple[str, str]], on: bool, delay: int
+    ) -> None:
+        """Send the commands to switch outlets and read their status back."""
+        metric = SNMP_OID_OUTLETS_SWITCH_ON if on else SNMP_OID_OUTLETS_SWITCH_OFF
+        # The command value is the number of seconds until the outlet switches.
+        values = {
+            self.registry.get(metric, unit, index): 1 + (step * delay if on else 0)
+            for step, (unit, index) in enumerate(outlets)
+        }
         try:
-            result = await self._api.set(oid, value, value_type)
-            _LOGGER.debug("Successfully set SNMP OID %s to %s", oid, value)
-            await self.async_refresh()
-            return result
+            await self._api.set_many(values, "Integer")
         except Exception:
-            _LOGGER.error("Failed to set SNMP OID %s: %s", oid, value)
+            _LOGGER.error("Failed to switch outlet(s) %s", outlets)
             raise
+
+        status = OUTLET_STATUS_ON if on else OUTLET_STATUS_OFF
+        expected = {
+            self.registry.get(SNMP_OID_OUTLETS_STATUS, unit, index): status
+            for unit, index in outlets
+        }
+        wait = max(values.values())
+        # Polls take over if the read back does not end, e.g. on cancellation.
+        deadline = time.monotonic() + wait + 2 * SWITCH_READ_BACK_TIMEOUT
+        for oid in expected:
+            if oid in self._expected:
+                self._expected_until[oid] = deadline
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_read_back(expected, wait),
+            f"{DOMAIN} read back {len(outlets)} outlet(s)",
+        )
+
+    async def _async_read_back(self, expected: dict[str, int], wait: int = 0) -> None:
+        """Read OIDs with a growing delay until they hold the expected values.
+
+        The expected values stay shown meanwhile and polls leave them alone,
+        so states the device passes through do not flicker. The values read
+        last are stored in the end, confirmed or not. Reading starts after the
+        given seconds the device waits before the last change. OIDs expected to
+        change again by a later command are left to its read back.
+        """
+        if wait > 1:
+            await asyncio.sleep(wait - 1)
+        deadline = time.monotonic() + SWITCH_READ_BACK_TIMEOUT
+        delay = SWITCH_READ_BACK_DELAY
+        pending = dict(expected)
+        last: dict = {}
+        while pending and time.monotonic() + delay < deadline:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, SWITCH_READ_BACK_DELAY_MAX)
+            pending = {
+                oid: value
+                for oid, value in pending.items()
+                if self._expected.get(oid) == value
+            }
+            if not pending:
+                break
+            try:
+                values = await self._api.get(list(pending), RequestPriority.CONTROL)
+            except RuntimeError as err:
+                _LOGGER.debug("Read back of %s failed: %s", sorted(pending), err)
+                continue
+            last.update(values)
+            pending = {
+                oid: value for oid, value in pending.items() if values.get(oid) != value
+            }
+
+        self._drop_expected(
+            oid for oid, value in expected.items() if self._expected.get(oid) == value
+        )
+        # Polls skipped the expected values meanwhile, so the values read are
+        # stored whether they confirm the command or not.
+        self.async_set_values(
+            {
+                oid: last[oid]
+                for oid in expected.keys() & last.keys()
+                if oid not in self._expected
+            }
+        )
+        pending = {
+            oid: value for oid, value in pending.items() if oid not in self._expected
+        }
+        if pending:
+            _LOGGER.warning("Device did not confirm %s in time", sorted(pending))
+            if pending.keys() - last.keys():
+                await self.async_request_refresh()
+
+    @callback
+    def async_set_values(self, values: dict) -> None:
+        """Store values outside a poll and update the listeners of changed OIDs."""
+        if self.data is None:
+            return
+        changed = self.data.update_changed(values)
+        if changed:
+            self._changed = changed
+            self.async_update_listeners()
+
+    @callback
+    def async_handle_notification(self, notification: str | None, values: dict) -> None:
+        """Apply a notification of the device and read the rows it refers to.
+
+        Values of polled OIDs are stored right away. The polled values of the
+        input and outlet rows named by the notification are read in the
+        background, as notifications rarely carry all of them. A restarted
+        device is discovered again. The notification is passed on as an event
+        for automations, e.g. on threshold alarms.
+        """
+        self.hass.bus.async_fire(
+            EVENT_NOTIFICATION,
+            {
+                "entry_id": self.config_entry.entry_id,
+                "notification": notification,
+                "values": values,
+            },
+        )
+        if self.data is None:
+            return
+
+        if notification in (SNMP_OID_TRAP_COLD_START, SNMP_OID_TRAP_WARM_START):
+            self._metadata_updated = None
+            self.config_entry.async_create_background_task(
+                self.hass, self.async_request_refresh(), f"{DOMAIN} rediscovery"
+            )
+            return
+
+        # OIDs of switched outlets are left to the read back of the command.
+        self.async_set_values(
+            {
+                oid: value
+                for oid, value in values.items()
+                if oid in self.data and oid not in self._expected
+            }
+        )
+        oids = {
+            oid
+            for notified in values
+            for oid in self._get_row_oids(notified)
+            if oid in self.data and oid not in values
+        }
+        if not oids:
+            return
+        self._notified.update(oids)
+        if not self._reading_notified:
+            self._reading_notified = True
+            self.config_entry.async_create_background_task(
+                self.hass, self._async_read_notified(), f"{DOMAIN} notified read"
+            )
+
+    def _get_row_oids(self, oid: str) -> list[str]:
+        """Return the OIDs of the polled columns of an input or outlet row."""
+        if oid.startswith(SNMP_OID_OUTLETS):
+            columns = OUTLET_COLUMNS
+        elif oid.startswith(SNMP_OID_INPUTS):
+            columns = INPUT_COLUMNS
+        else:
+            return []
+        arcs = oid.split(".")
+        if len(arcs) <= SNMP_OID_TABLE_UNIT_ARC + 1:
+            return []
+        unit, index = arcs[SNMP_OID_TABLE_UNIT_ARC], arcs[-1]
+        return [self.registry.get(column, unit, index) for column in columns]
+
+    async def _async_read_notified(self) -> None:
+        """Read the OIDs of notifications, including those arriving meanwhile."""
+        try:
+            while self._notified:
+                oids = sorted(self._notified)
+                self._notified.clear()
+                try:
+                    values = await self._api.get(oids, RequestPriority.CONTROL)
+                except RuntimeError as err:
+                    _LOGGER.debug("Read of notified %s failed: %s", oids, err)
+                    continue
+                self.async_set_values(
+                    {
+                        oid: value
+                        for oid, value in values.items()
+                        if oid not in self._expected
+                    }
+                )
+        finally:
+            self._reading_notified = False
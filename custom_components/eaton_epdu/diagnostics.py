@@ -0,0 +1,47 @@
+"""Diagnostics support for Eaton ePDU."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    ATTR_AUTH_KEY,
+    ATTR_AUTH_KEY_WRITE,
+    ATTR_COMMUNITY,
+    ATTR_COMMUNITY_WRITE,
+    ATTR_HOST,
+    ATTR_PRIV_KEY,
+    ATTR_PRIV_KEY_WRITE,
+    ATTR_TRAP_COMMUNITY,
+    ATTR_USERNAME,
+    ATTR_USERNAME_WRITE,
+)
+from .coordinator import SnmpCoordinator
+
+TO_REDACT = {
+    ATTR_HOST,
+    ATTR_COMMUNITY,
+    ATTR_COMMUNITY_WRITE,
+    ATTR_USERNAME,
+    ATTR_USERNAME_WRITE,
+    ATTR_AUTH_KEY,
+    ATTR_AUTH_KEY_WRITE,
+    ATTR_PRIV_KEY,
+    ATTR_PRIV_KEY_WRITE,
+    ATTR_TRAP_COMMUNITY,
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: SnmpCoordinator = entry.runtime_data
+    return {
+        "config": async_redact_data(dict(entry.data), TO_REDACT),
+        **coordinator.get_diagnostics(),
+    }
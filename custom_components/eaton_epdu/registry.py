@@ -0,0 +1,47 @@
+"""OID registry for Eaton ePDU."""
+
+from __future__ import annotations
+
+import pysnmp.hlapi.asyncio as hlapi
+
+
+class OidRegistry:
+    """Provide preformatted OIDs and prebuilt object types."""
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._oids: dict[tuple[str, str, str | None], str] = {}
+        self._object_types: dict[str, hlapi.ObjectType] = {}
+
+    def get(self, metric: str, unit: str, index: str | None = None) -> str:
+        """Return the OID of a metric for the given unit and index.
+
+        Without an index the OID of the whole table column is returned.
+        """
+        key = (metric, unit, index)
+        oid = self._oids.get(key)
+        if oid is None:
+            oid = metric.replace("unit", unit)
+            if index is None:
+                oid = oid.replace(".index", "")
+            else:
+                oid = oid.replace("index", index)
+            self._oids[key] = oid
+        return oid
+
+    def object_type(self, oid: str) -> hlapi.ObjectType:
+        """Return a reusable object type for the given OID."""
+        object_type = self._object_types.get(oid)
+        if object_type is None:
+            object_type = hlapi.ObjectType(hlapi.ObjectIdentity(oid))
+            self._object_types[oid] = object_type
+        return object_type
+
+    def object_types(self, oids) -> list[hlapi.ObjectType]:
+        """Return reusable object types for the given OIDs."""
+        return [self.object_type(oid) for oid in oids]
+
+    def clear(self) -> None:
+        """Forget all OIDs, e.g. after the topology changed."""
+        self._oids.clear()
+        self._object_types.clear()
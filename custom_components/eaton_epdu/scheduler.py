@@ -0,0 +1,108 @@
+"""Fleet wide poll scheduler for Eaton ePDU."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager, suppress
+import logging
+
+from .const import MAX_REQUESTS_GLOBAL_DEFAULT, RequestPriority
+
+_LOGGER = logging.getLogger(__name__)
+
+# Successive multiples of the golden ratio modulo 1 stay evenly spread for any
+# number of entries, so phases do not have to be reassigned when entries change.
+GOLDEN_RATIO_CONJUGATE = 0.6180339887498949
+
+
+class PollScheduler:
+    """Spread the polls of all config entries and cap concurrent requests."""
+
+    def __init__(self, max_requests: int = MAX_REQUESTS_GLOBAL_DEFAULT) -> None:
+        """Initialize the scheduler."""
+        self.semaphore = PrioritySemaphore(max_requests)
+        self.lags: dict[str, float] = {}
+        self._slots: dict[str, int] = {}
+
+    def register(self, entry_id: str) -> float:
+        """Register a config entry and return its poll phase between 0 and 1."""
+        slot = self._slots.get(entry_id)
+        if slot is None:
+            used = set(self._slots.values())
+            slot = next(slot for slot in range(len(used) + 1) if slot not in used)
+            self._slots[entry_id] = slot
+        return (slot * GOLDEN_RATIO_CONJUGATE) % 1
+
+    def unregister(self, entry_id: str) -> None:
+        """Unregister a config entry."""
+        self._slots.pop(entry_id, None)
+        self.lags.pop(entry_id, None)
+
+    def report_lag(self, entry_id: str, lag: float) -> None:
+        """Record how late the poll of a config entry started."""
+        self.lags[entry_id] = lag
+        _LOGGER.debug("Poll of %s started %.3fs late", entry_id, lag)
+
+    @property
+    def entries(self) -> int:
+        """Return the number of registered config entries."""
+        return len(self._slots)
+
+
+class PrioritySemaphore:
+    """Limit concurrent requests and let waiters of a higher priority go first.
+
+    A released slot is handed straight to the next waiter, so requests of a
+    lower priority cannot take it in between.
+    """
+
+    def __init__(self, value: int) -> None:
+        """Initialize the semaphore with the number of slots."""
+        self._value = value
+        self._waiters: dict[RequestPriority, deque[asyncio.Future]] = {
+            priority: deque() for priority in sorted(RequestPriority)
+        }
+
+    def locked(self) -> bool:
+        """Return True if no slot is free."""
+        return self._value <= 0
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.POLL) -> None:
+        """Wait for a free slot."""
+        if self._value > 0 and not any(self._waiters.values()):
+            self._value -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before the cancellation.
+                self.release()
+            else:
+                # A release may have dropped the cancelled waiter already.
+                with suppress(ValueError):
+                    self._waiters[priority].remove(future)
+            raise
+
+    def release(self) -> None:
+        """Hand a slot to the next waiter of the highest priority or free it."""
+        for waiters in self._waiters.values():
+            while waiters:
+                future = waiters.popleft()
+                if not future.done():
+                    future.set_result(None)
+                    return
+        self._value += 1
+
+    @asynccontextmanager
+    async def slot(self, priority: RequestPriority = RequestPriority.POLL):
+        """Hold a slot within a context."""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
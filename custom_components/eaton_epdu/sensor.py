@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import timedelta
+import time
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -11,16 +13,33 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    EntityCategory,
     UnitOfElectricCurrent,
     UnitOfElectricPotential,
     UnitOfEnergy,
+    UnitOfInformation,
     UnitOfPower,
+    UnitOfTime,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     ATTR_ACCURATE_POWER,
+    ATTR_DEADBAND_CURRENT,
+    ATTR_DEADBAND_CURRENT_RELATIVE,
+    ATTR_DEADBAND_ENERGY,
+    ATTR_DEADBAND_ENERGY_RELATIVE,
+    ATTR_DEADBAND_POWER,
+    ATTR_DEADBAND_POWER_FACTOR,
+    ATTR_DEADBAND_POWER_FACTOR_RELATIVE,
+    ATTR_DEADBAND_POWER_RELATIVE,
+    ATTR_DEADBAND_VOLTAGE,
+    ATTR_DEADBAND_VOLTAGE_RELATIVE,
+    ATTR_MAX_SILENCE,
+    ATTR_MIN_WRITE_INTERVAL,
     DOMAIN,
     SNMP_OID_INPUTS_CURRENT,
     SNMP_OID_INPUTS_FEED_NAME,
@@ -54,8 +73,7 @@ async def async_setup_entry(
     for unit in coordinator.get_units():
         for index in range(
             1,
-            coordinator.data.get(SNMP_OID_UNITS_INPUT_COUNT.replace("unit", unit), 0)
-            + 1,
+            coordinator.get_unit_data(SNMP_OID_UNITS_INPUT_COUNT, unit, default=0) + 1,
         ):
             entities.append(SnmpInputCurrentSensorEntity(coordinator, unit, str(index)))
             entities.append(SnmpInputPFSensorEntity(coordinator, unit, str(index)))
@@ -74,8 +92,7 @@ async def async_setup_entry(
 
         for index in range(
             1,
-            coordinator.data.get(SNMP_OID_UNITS_OUTLET_COUNT.replace("unit", unit), 0)
-            + 1,
+            coordinator.get_unit_data(SNMP_OID_UNITS_OUTLET_COUNT, unit, default=0) + 1,
         ):
             entities.append(
                 SnmpOutletCurrentSensorEntity(coordinator, unit, str(index))
@@ -98,10 +115,167 @@ async def async_setup_entry(
                 SnmpOutletWattHoursSensorEntity(coordinator, unit, str(index))
             )
 
+    units = coordinator.get_units()
+    if units:
+        # Request statistics belong to the host, so they are added to its first unit.
+        entities.extend(
+            entity_class(coordinator, units[0])
+            for entity_class in (
+                SnmpMaxVarBindsSensorEntity,
+                SnmpPollDurationSensorEntity,
+                SnmpPollLagSensorEntity,
+                SnmpPollRequestsSensorEntity,
+                SnmpPollVarBindsSentSensorEntity,
+                SnmpPollVarBindsReceivedSensorEntity,
+                SnmpPollBytesReceivedSensorEntity,
+                SnmpTimeoutsSensorEntity,
+                SnmpRetriesSensorEntity,
+                SnmpTimeoutRetriesSensorEntity,
+                SnmpRemovedOidsSensorEntity,
+                SnmpRttP50SensorEntity,
+                SnmpRttP95SensorEntity,
+            )
+        )
+
     async_add_entities(entities)
 
 
-class SnmpSensorEntity(SnmpEntity, SensorEntity):
+@dataclass(frozen=True, slots=True)
+class SensorFilter:
+    """Deadband and write interval settings of a sensor."""
+
+    absolute: float = 0.0
+    relative: float = 0.0
+    min_interval: float = 0.0
+    max_silence: float = 0.0
+
+    @classmethod
+    def from_config(
+        cls, data: ConfigType, device_class: SensorDeviceClass | None
+    ) -> SensorFilter:
+        """Create the filter of a device class from the config entry data."""
+        absolute_key, relative_key = DEADBANDS.get(device_class, (None, None))
+        return cls(
+            absolute=data.get(absolute_key, 0.0),
+            relative=data.get(relative_key, 0.0),
+            min_interval=data.get(ATTR_MIN_WRITE_INTERVAL, 0),
+            max_silence=data.get(ATTR_MAX_SILENCE, 0),
+        )
+
+    def is_significant(self, old, new, elapsed: float) -> bool:
+        """Return True if the change from old to new value should be written."""
+        if old is None or new is None:
+            return old is not new
+        if self.max_silence and elapsed >= self.max_silence:
+            return True
+        return abs(new - old) > max(self.absolute, self.relative / 100 * abs(old))
+
+
+DEADBANDS = {
+    SensorDeviceClass.CURRENT: (ATTR_DEADBAND_CURRENT, ATTR_DEADBAND_CURRENT_RELATIVE),
+    SensorDeviceClass.VOLTAGE: (ATTR_DEADBAND_VOLTAGE, ATTR_DEADBAND_VOLTAGE_RELATIVE),
+    SensorDeviceClass.POWER_FACTOR: (
+        ATTR_DEADBAND_POWER_FACTOR,
+        ATTR_DEADBAND_POWER_FACTOR_RELATIVE,
+    ),
+    SensorDeviceClass.POWER: (ATTR_DEADBAND_POWER, ATTR_DEADBAND_POWER_RELATIVE),
+    SensorDeviceClass.ENERGY: (ATTR_DEADBAND_ENERGY, ATTR_DEADBAND_ENERGY_RELATIVE),
+}
+
+
+class SnmpFilteredSensorEntity(SnmpEntity, SensorEntity):
+    """Representation of a Eaton ePDU sensor which filters insignificant changes."""
+
+    _last_write: float = 0.0
+    _written_available: bool | None = None
+    _written_stale: bool | None = None
+    _pending_value: float | None = None
+    _pending_write: CALLBACK_TYPE | None = None
+    _latest_value: float | None = None
+    _heartbeat: CALLBACK_TYPE | None = None
+
+    def __init__(self, coordinator: SnmpCoordinator, unit: str) -> None:
+        """Initialize a Eaton ePDU sensor."""
+        super().__init__(coordinator, unit)
+        self._filter = SensorFilter.from_config(
+            coordinator.config_entry.data, self._attr_device_class
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending write and the heartbeat."""
+        await super().async_will_remove_from_hass()
+        if self._pending_write is not None:
+            self._pending_write()
+            self._pending_write = None
+        if self._heartbeat is not None:
+            self._heartbeat()
+            self._heartbeat = None
+
+    @callback
+    def _async_write_value(self, value) -> None:
+        """Write the value unless the change is insignificant.
+
+        A change of the availability or of the stale mark is always written,
+        together with the latest value. The latest value is also written after
+        the maximum silence without a write, even if it did not change.
+        """
+        self._latest_value = value
+        if self._pending_write is not None:
+            self._pending_write()
+            self._pending_write = None
+
+        now = time.monotonic()
+        if (
+            self.available != self._written_available
+            or self.coordinator.stale != self._written_stale
+        ):
+            self._async_write_now(value, now)
+            return
+
+        if not self._filter.is_significant(
+            self._attr_native_value, value, now - self._last_write
+        ):
+            return
+
+        delay = self._filter.min_interval - (now - self._last_write)
+        if delay > 0:
+            self._pending_value = value
+            self._pending_write = async_call_later(
+                self.hass, delay, self._async_write_pending
+            )
+            return
+
+        self._async_write_now(value, now)
+
+    @callback
+    def _async_write_pending(self, _now) -> None:
+        """Write the value held back by the minimum write interval."""
+        self._pending_write = None
+        self._async_write_now(self._pending_value, time.monotonic())
+
+    @callback
+    def _async_write_heartbeat(self, _now) -> None:
+        """Write the latest value after the maximum silence."""
+        self._heartbeat = None
+        self._async_write_now(self._latest_value, time.monotonic())
+
+    @callback
+    def _async_write_now(self, value, now: float) -> None:
+        """Write the value and remember when and how it was written."""
+        self._attr_native_value = value
+        self._last_write = now
+        self._written_available = self.available
+        self._written_stale = self.coordinator.stale
+        super().async_write_ha_state()
+        if self._filter.max_silence:
+            if self._heartbeat is not None:
+                self._heartbeat()
+            self._heartbeat = async_call_later(
+                self.hass, self._filter.max_silence, self._async_write_heartbeat
+            )
+
+
+class SnmpSensorEntity(SnmpFilteredSensorEntity, SensorEntity):
     """Representation of a Eaton ePDU sensor."""
 
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -119,8 +293,9 @@ class SnmpSensorEntity(SnmpEntity, SensorEntity):
     def __init__(self, coordinator: SnmpCoordinator, unit: str, index: str) -> None:
         """Initialize a Eaton ePDU sensor."""
         super().__init__(coordinator, unit)
-        self._name_oid = self._name_oid.replace("unit", unit).replace("index", index)
-        self._value_oid = self._value_oid.replace("unit", unit).replace("index", index)
+        self._name_oid = coordinator.registry.get(self._name_oid, unit, index)
+        self._value_oid = coordinator.registry.get(self._value_oid, unit, index)
+        self.coordinator_context = frozenset((self._value_oid,))
         device_name = self.device_info["name"]
         sensor_name = self.coordinator.data.get(self._name_oid)
         self._attr_name = (
@@ -136,13 +311,11 @@ class SnmpSensorEntity(SnmpEntity, SensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._attr_native_value = self.coordinator.data.get(
-            self._value_oid, self._default_value
-        )
+        value = self.coordinator.data.get(self._value_oid, self._default_value)
         if self._multiplier is not None:
-            self._attr_native_value *= self._multiplier
+            value *= self._multiplier
 
-        super().async_write_ha_state()
+        self._async_write_value(value)
 
 
 class SnmpInputSensorEntity(SnmpSensorEntity, SensorEntity):
@@ -265,7 +438,7 @@ class SnmpOutletWattHoursSensorEntity(SnmpOutletSensorEntity, SensorEntity):
     _value_oid = SNMP_OID_OUTLETS_WATT_HOURS
 
 
-class SnmpInputVAPhiSensorEntity(SnmpEntity, SensorEntity):
+class SnmpInputVAPhiSensorEntity(SnmpFilteredSensorEntity, SensorEntity):
     """Takes voltage, current and power factor and generates a power sensor."""
 
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -284,9 +457,18 @@ class SnmpInputVAPhiSensorEntity(SnmpEntity, SensorEntity):
         """Initialize a Eaton ePDU sensor."""
         super().__init__(coordinator, unit)
 
-        self._index = index
+        self._voltage_oid = coordinator.registry.get(
+            SNMP_OID_INPUTS_VOLTAGE, unit, index
+        )
+        self._current_oid = coordinator.registry.get(
+            SNMP_OID_INPUTS_CURRENT, unit, index
+        )
+        self._pf_oid = coordinator.registry.get(SNMP_OID_INPUTS_PF, unit, index)
+        self.coordinator_context = frozenset(
+            (self._voltage_oid, self._current_oid, self._pf_oid)
+        )
 
-        self._name_oid = self._name_oid.replace("unit", unit).replace("index", index)
+        self._name_oid = coordinator.registry.get(self._name_oid, unit, index)
         device_name = self.device_info["name"]
         sensor_name = self.coordinator.data.get(self._name_oid)
         self._attr_name = (
@@ -299,35 +481,18 @@ class SnmpInputVAPhiSensorEntity(SnmpEntity, SensorEntity):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
 
-        self._attr_native_value = self.get_value()
-
-        super().async_write_ha_state()
+        self._async_write_value(self.get_value())
 
     def get_value(self) -> float:
         """Return calculated value."""
-        voltage = self.coordinator.data.get(
-            SNMP_OID_INPUTS_VOLTAGE.replace("unit", self._unit).replace(
-                "index", self._index
-            ),
-            0,
-        )
-        current = self.coordinator.data.get(
-            SNMP_OID_INPUTS_CURRENT.replace("unit", self._unit).replace(
-                "index", self._index
-            ),
-            0,
-        )
-        cosphi = self.coordinator.data.get(
-            SNMP_OID_INPUTS_PF.replace("unit", self._unit).replace(
-                "index", self._index
-            ),
-            0,
-        )
+        voltage = self.coordinator.data.get(self._voltage_oid, 0)
+        current = self.coordinator.data.get(self._current_oid, 0)
+        cosphi = self.coordinator.data.get(self._pf_oid, 0)
 
         return (voltage / 1000.0) * (current / 1000) * (abs(cosphi) / 1000)
 
 
-class SnmpOutputVAPhiSensorEntity(SnmpEntity, SensorEntity):
+class SnmpOutputVAPhiSensorEntity(SnmpFilteredSensorEntity, SensorEntity):
     """Takes voltage, current and power factor and generates a power sensor."""
 
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -348,10 +513,18 @@ class SnmpOutputVAPhiSensorEntity(SnmpEntity, SensorEntity):
         """Initialize a Eaton ePDU sensor."""
         super().__init__(coordinator, unit)
 
-        self._index = index
-        self._input_index = input_index
+        self._voltage_oid = coordinator.registry.get(
+            SNMP_OID_INPUTS_VOLTAGE, unit, input_index
+        )
+        self._current_oid = coordinator.registry.get(
+            SNMP_OID_OUTLETS_CURRENT, unit, index
+        )
+        self._pf_oid = coordinator.registry.get(SNMP_OID_OUTLETS_PF, unit, index)
+        self.coordinator_context = frozenset(
+            (self._voltage_oid, self._current_oid, self._pf_oid)
+        )
 
-        self._name_oid = self._name_oid.replace("unit", unit).replace("index", index)
+        self._name_oid = coordinator.registry.get(self._name_oid, unit, index)
         device_name = self.device_info["name"]
         sensor_name = self.coordinator.data.get(self._name_oid)
         self._attr_name = (
@@ -364,29 +537,146 @@ class SnmpOutputVAPhiSensorEntity(SnmpEntity, SensorEntity):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
 
-        self._attr_native_value = self.get_value()
-
-        super().async_write_ha_state()
+        self._async_write_value(self.get_value())
 
     def get_value(self) -> float:
         """Return calculated value."""
-        voltage = self.coordinator.data.get(
-            SNMP_OID_INPUTS_VOLTAGE.replace("unit", self._unit).replace(
-                "index", self._input_index
-            ),
-            0,
-        )
-        current = self.coordinator.data.get(
-            SNMP_OID_OUTLETS_CURRENT.replace("unit", self._unit).replace(
-                "index", self._index
-            ),
-            0,
-        )
-        cosphi = self.coordinator.data.get(
-            SNMP_OID_OUTLETS_PF.replace("unit", self._unit).replace(
-                "index", self._index
-            ),
-            0,
-        )
+        voltage = self.coordinator.data.get(self._voltage_oid, 0)
+        current = self.coordinator.data.get(self._current_oid, 0)
+        cosphi = self.coordinator.data.get(self._pf_oid, 0)
 
         return (voltage / 1000.0) * (current / 1000) * (abs(cosphi) / 1000)
+
+
+class SnmpDiagnosticSensorEntity(SnmpEntity, SensorEntity):
+    """Representation of a Eaton ePDU diagnostic sensor.
+
+    Subclasses set the key of the coordinator statistic they report.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    _key: str = ""
+    _name_suffix: str = ""
+
+    def __init__(self, coordinator: SnmpCoordinator, unit: str) -> None:
+        """Initialize a Eaton ePDU diagnostic sensor."""
+        super().__init__(coordinator, unit)
+        self._attr_name = f"{self.device_info['name']} {self._name_suffix}"
+        self._attr_unique_id = f"{DOMAIN}_{self.identifier}_{self._key}"
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the statistic of the last poll."""
+        return self.coordinator.statistics.get(self._key)
+
+
+class SnmpMaxVarBindsSensorEntity(SnmpDiagnosticSensorEntity, SensorEntity):
+    """Representation of the learned number of varbinds per request."""
+
+    _key = "max_varbinds"
+    _name_suffix = "Max Varbinds per Request"
+
+
+class SnmpPollDurationSensorEntity(SnmpDiagnosticSensorEntity, SensorEntity):
+    """Representation of the duration of the last poll."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 0
+    _key = "poll_duration"
+    _name_suffix = "Poll Duration"
+
+
+class SnmpPollLagSensorEntity(SnmpDiagnosticSensorEntity, SensorEntity):
+    """Representation of how late the last poll started."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 0
+    _key = "poll_lag"
+    _name_suffix = "Poll Lag"
+
+
+class SnmpPollRequestsSensorEntity(SnmpDiagnosticSensorEntity, SensorEntity):
+    """Representation of the round trips of the last poll."""
+
+    _key = "poll_requests"
+    _name_suffix = "Poll Round Trips"
+
+
+class SnmpPollVarBindsSentSensorEntity(SnmpDiagnosticSensorEntity, SensorEntity):
+    """Representation of the varbinds requested by the last poll."""
+
+    _key = "poll_varbinds_sent"
+    _name_suffix = "Poll Varbinds Sent"
+
+
+class SnmpPollVarBindsReceivedSensorEntity(SnmpDiagnosticSensorEntity, SensorEntity):
+    """Representation of the varbinds received by the last poll."""
+
+    _key = "poll_varbinds_received"
+    _name_suffix = "Poll Varbinds Received"
+
+
+class SnmpPollBytesReceivedSensorEntity(SnmpDiagnosticSensorEntity, SensorEntity):
+    """Representation of the approximate varbind bytes of the last poll."""
+
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
+    _key = "poll_bytes_received"
+    _name_suffix = "Poll Bytes Received"
+
+
+class SnmpTimeoutsSensorEntity(SnmpDiagnosticSensorEntity, SensorEntity):
+    """Representation of the requests which timed out."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _key = "timeouts"
+    _name_suffix = "Request Timeouts"
+
+
+class SnmpRetriesSensorEntity(SnmpDiagnosticSensorEntity, SensorEntity):
+    """Representation of the requests sent again in a smaller form."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _key = "retries"
+    _name_suffix = "Request Retries"
+
+
+class SnmpTimeoutRetriesSensorEntity(SnmpDiagnosticSensorEntity, SensorEntity):
+    """Representation of the requests sent again after a timeout."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _key = "timeout_retries"
+    _name_suffix = "Request Timeout Retries"
+
+
+class SnmpRemovedOidsSensorEntity(SnmpDiagnosticSensorEntity, SensorEntity):
+    """Representation of the OIDs removed as unsupported."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _key = "removed_oids"
+    _name_suffix = "Removed OIDs"
+
+
+class SnmpRttP50SensorEntity(SnmpDiagnosticSensorEntity, SensorEntity):
+    """Representation of the median round trip time of recent requests."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 1
+    _key = "rtt_p50"
+    _name_suffix = "Round Trip Time p50"
+
+
+class SnmpRttP95SensorEntity(SnmpDiagnosticSensorEntity, SensorEntity):
+    """Representation of the 95th percentile round trip time of recent requests."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 1
+    _key = "rtt_p95"
+    _name_suffix = "Round Trip Time p95"
@@ -0,0 +1,66 @@
+"""Services for Eaton ePDU."""
+
+from __future__ import annotations
+
+import asyncio
+
+import voluptuous as vol
+
+from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.service import async_extract_entity_ids
+
+from .const import ATTR_DELAY, ATTR_STATE, DOMAIN, SERVICE_SET_OUTLETS
+from .coordinator import SnmpCoordinator
+from .switch import SnmpSwitchEntity
+
+SET_OUTLETS_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_STATE): cv.boolean,
+        vol.Optional(ATTR_DELAY, default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=600)
+        ),
+    }
+)
+
+
+def _outlet_order(outlet: tuple[str, str]) -> tuple[int, int]:
+    """Return the sort key of an outlet by unit and outlet number."""
+    unit, index = outlet
+    return int(unit), int(index)
+
+
+async def async_set_outlets(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Switch outlet switches with one batch of SET requests per host."""
+    component = hass.data[SWITCH_DOMAIN]
+    outlets: dict[SnmpCoordinator, list[tuple[str, str]]] = {}
+    for entity_id in await async_extract_entity_ids(hass, call):
+        entity = component.get_entity(entity_id)
+        if not isinstance(entity, SnmpSwitchEntity):
+            raise ServiceValidationError(f"{entity_id} is not an Eaton ePDU outlet")
+        outlets.setdefault(entity.coordinator, []).append(entity.outlet)
+
+    # Outlets are switched on in the order of the daisy chain.
+    await asyncio.gather(
+        *(
+            coordinator.async_switch_outlets(
+                sorted(coordinator_outlets, key=_outlet_order),
+                call.data[ATTR_STATE],
+                call.data[ATTR_DELAY],
+            )
+            for coordinator, coordinator_outlets in outlets.items()
+        )
+    )
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def set_outlets(call: ServiceCall) -> None:
+        await async_set_outlets(hass, call)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_OUTLETS, set_outlets, schema=SET_OUTLETS_SCHEMA
+    )
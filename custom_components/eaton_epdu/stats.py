@@ -0,0 +1,186 @@
+"""Request statistics of Eaton ePDU."""
+
+from __future__ import annotations
+
+from collections import deque
+import math
+
+from pyasn1.type import univ
+from pysnmp.proto import errind
+
+# Round trip times kept for the rolling percentiles.
+RTT_WINDOW = 100
+
+# Weights of the latest round trip in the smoothed round trip time and its
+# variance, and the clock granularity in seconds, as in RFC 6298.
+RTT_ALPHA = 1 / 8
+RTT_BETA = 1 / 4
+RTT_GRANULARITY = 0.01
+
+# Step in seconds the timeouts are rounded up to. pysnmp configures a target
+# address for every distinct timeout, so they must not vary freely.
+TIMEOUT_STEP = 0.1
+
+# Requests using the whole learned number of variable bindings before a larger
+# request is tried again.
+VARBINDS_PROBE_REQUESTS = 20
+
+# Counters reported per poll as the difference between its start and end.
+POLL_COUNTERS = ("requests", "varbinds_sent", "varbinds_received", "bytes_received")
+
+
+def estimate_size(var_binds) -> int:
+    """Return the approximate BER encoded size of variable bindings.
+
+    Encoding the values again only to measure them would cost more than the
+    decoding, so the size is estimated from the OID arcs and the value length.
+    """
+    size = 0
+    for var_bind in var_binds:
+        value = var_bind[1]
+        if isinstance(value, univ.Integer):
+            length = int(value).bit_length() // 8 + 1
+        elif isinstance(value, univ.OctetString):
+            length = len(value)
+        else:
+            length = 0
+        # Tag and length octets of the sequence, the name and the value.
+        size += str(var_bind[0]).count(".") + length + 7
+    return size
+
+
+class RequestStats:
+    """Count the requests to a device and keep their recent round trip times."""
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.requests = 0
+        self.varbinds_sent = 0
+        self.varbinds_received = 0
+        self.bytes_received = 0
+        self.timeouts = 0
+        self.retries = 0
+        self.timeout_retries = 0
+        self.hedges = 0
+        self.removed_oids = 0
+        self.rtts: deque[float] = deque(maxlen=RTT_WINDOW)
+        # Requests of the running poll, None while no poll is traced.
+        self.log: list[dict] | None = None
+
+    def add_request(
+        self, command: str, varbinds_sent: int, response: tuple, rtt: float
+    ) -> None:
+        """Count a request and its response."""
+        error_indication, error_status, _, var_binds = response
+        if self.log is not None:
+            self.log.append(
+                {
+                    "command": command,
+                    "oids": varbinds_sent,
+                    "varbinds": len(var_binds),
+                    "rtt": round(rtt * 1000, 3),
+                    "error_indication": (
+                        str(error_indication) if error_indication else None
+                    ),
+                    "error_status": int(error_status or 0),
+                    "decode": None,
+                }
+            )
+        self.requests += 1
+        self.varbinds_sent += varbinds_sent
+        if isinstance(error_indication, errind.RequestTimedOut):
+            self.timeouts += 1
+            return
+        self.varbinds_received += len(var_binds)
+        self.bytes_received += estimate_size(var_binds)
+        self.rtts.append(rtt)
+
+    def add_decode_time(self, seconds: float) -> None:
+        """Add the time to decode the response of the latest request.
+
+        Responses are decoded without yielding to the event loop, so the latest
+        request is the one whose response was decoded.
+        """
+        if self.log:
+            self.log[-1]["decode"] = round(seconds * 1000, 3)
+
+    def counters(self) -> dict[str, int]:
+        """Return the counters reported per poll."""
+        return {name: getattr(self, name) for name in POLL_COUNTERS}
+
+    def rtt_percentile(self, percentile: int) -> float | None:
+        """Return a percentile of the recent round trip times in seconds."""
+        if not self.rtts:
+            return None
+        ordered = sorted(self.rtts)
+        return ordered[min(len(ordered) * percentile // 100, len(ordered) - 1)]
+
+
+class RttEstimator:
+    """Derive the timeout of a device from its round trip times like TCP does."""
+
+    def __init__(self, timeout_min: float, timeout_max: float, initial: float) -> None:
+        """Initialize the estimator with the timeout bounds in seconds."""
+        self.timeout_min = timeout_min
+        self.timeout_max = max(timeout_max, timeout_min)
+        self._initial = initial
+        self.srtt: float | None = None
+        self.rttvar: float | None = None
+
+    def add(self, rtt: float) -> None:
+        """Add the round trip time of an answered request."""
+        if self.srtt is None or self.rttvar is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+            return
+        self.rttvar = (1 - RTT_BETA) * self.rttvar + RTT_BETA * abs(self.srtt - rtt)
+        self.srtt = (1 - RTT_ALPHA) * self.srtt + RTT_ALPHA * rtt
+
+    @property
+    def timeout(self) -> float:
+        """Return the timeout of the next request in seconds."""
+        if self.srtt is None or self.rttvar is None:
+            timeout = self._initial
+        else:
+            timeout = self.srtt + max(RTT_GRANULARITY, 4 * self.rttvar)
+        return self.bound(timeout)
+
+    def bound(self, timeout: float) -> float:
+        """Return a timeout within the bounds, rounded up to the timeout step."""
+        timeout = min(max(timeout, self.timeout_min), self.timeout_max)
+        return round(math.ceil(round(timeout / TIMEOUT_STEP, 6)) * TIMEOUT_STEP, 3)
+
+
+class VarBindLimit:
+    """Learn how many variable bindings a device handles in one message.
+
+    The limit is lowered whenever a message was too big. After a number of
+    requests succeeded at the limit, it is raised by a quarter again, as the
+    message may only have been too big for the values of the time.
+    """
+
+    def __init__(self, maximum: int) -> None:
+        """Initialize the limit with the largest number to try."""
+        self.maximum = maximum
+        self.value = maximum
+        self._successes = 0
+
+    def reduce(self, value: int) -> bool:
+        """Lower the limit to the given number, return True if it was lowered."""
+        self._successes = 0
+        value = max(value, 1)
+        if value >= self.value:
+            return False
+        self.value = value
+        return True
+
+    def succeed(self, varbinds: int) -> bool:
+        """Count a successful request, return True if the limit was raised."""
+        if varbinds < self.value or self.value >= self.maximum:
+            return False
+        self._successes += 1
+        if self._successes < VARBINDS_PROBE_REQUESTS:
+            return False
+        self._successes = 0
+        self.value = min(self.value + max(self.value // 4, 1), self.maximum)
+        return True
@@ -0,0 +1,146 @@
+"""Measurement store for Eaton ePDU."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator, MutableMapping
+from typing import Any
+
+_MISSING = object()
+
+
+class Column:
+    """Contiguous column of raw integer values indexed by row number."""
+
+    __slots__ = ("present", "values")
+
+    def __init__(self, size: int) -> None:
+        """Initialize an empty column."""
+        self.values = array("q", bytes(8 * size))
+        self.present = bytearray(size)
+
+    def resize(self, size: int) -> None:
+        """Grow or shrink the column to the given number of rows."""
+        if size > len(self.values):
+            self.values.extend(bytes(8 * (size - len(self.values))))
+            self.present.extend(bytes(size - len(self.present)))
+        else:
+            del self.values[size:]
+            del self.present[size:]
+
+    def get(self, row: int, default=None):
+        """Return the value of a row (1-based) or the default."""
+        if 0 < row <= len(self.values) and self.present[row - 1]:
+            return self.values[row - 1]
+        return default
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.values)
+
+
+class MeasurementStore(MutableMapping):
+    """Store table values in columns while providing a mapping by OID.
+
+    Integer values of registered table columns are kept in one array per
+    column, all other values are kept in a plain dict.
+    """
+
+    def __init__(self, values: dict | None = None) -> None:
+        """Initialize the store."""
+        self._columns: dict[str, Column] = {}
+        self._values: dict[str, Any] = {}
+        if values:
+            self.update(values)
+
+    def set_columns(self, columns: dict[str, int]) -> None:
+        """Register table columns with their row count and drop all others."""
+        for prefix in self._columns.keys() - columns.keys():
+            del self._columns[prefix]
+        for prefix, size in columns.items():
+            column = self._columns.get(prefix)
+            if column is None:
+                self._columns[prefix] = Column(size)
+            elif len(column) != size:
+                column.resize(size)
+
+    def column(self, prefix: str) -> Column | None:
+        """Return the column registered for the given OID prefix."""
+        return self._columns.get(prefix)
+
+    def update_changed(self, values: dict) -> set[str]:
+        """Update the store and return the OIDs whose value changed."""
+        changed = set()
+        for oid, value in values.items():
+            if self.get(oid, _MISSING) != value:
+                self[oid] = value
+                changed.add(oid)
+        return changed
+
+    def _locate(self, oid: str) -> tuple[Column | None, int]:
+        """Return column and row of an OID if it belongs to a column."""
+        prefix, _, row = oid.rpartition(".")
+        column = self._columns.get(prefix)
+        if column is None or not row.isdigit():
+            return None, 0
+        return column, int(row)
+
+    def __getitem__(self, oid: str):
+        """Return the value of an OID."""
+        column, row = self._locate(oid)
+        if column is not None:
+            value = column.get(row, _MISSING)
+            if value is not _MISSING:
+                return value
+        return self._values[oid]
+
+    def get(self, oid: str, default=None):
+        """Return the value of an OID or the default."""
+        column, row = self._locate(oid)
+        if column is not None:
+            value = column.get(row, _MISSING)
+            if value is not _MISSING:
+                return value
+        return self._values.get(oid, default)
+
+    def __setitem__(self, oid: str, value) -> None:
+        """Set the value of an OID."""
+        column, row = self._locate(oid)
+        if (
+            column is not None
+            and 0 < row <= len(column)
+            and isinstance(value, int)
+            and -(2**63) <= value < 2**63
+        ):
+            column.values[row - 1] = value
+            column.present[row - 1] = 1
+            self._values.pop(oid, None)
+            return
+        if column is not None and 0 < row <= len(column):
+            column.present[row - 1] = 0
+        self._values[oid] = value
+
+    def __delitem__(self, oid: str) -> None:
+        """Remove the value of an OID."""
+        column, row = self._locate(oid)
+        if column is not None and 0 < row <= len(column) and column.present[row - 1]:
+            column.present[row - 1] = 0
+            return
+        del self._values[oid]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over all OIDs with a value."""
+        for prefix, column in self._columns.items():
+            for row, present in enumerate(column.present, 1):
+                if present:
+                    yield f"{prefix}.{row}"
+        yield from self._values
+
+    def __len__(self) -> int:
+        """Return the number of OIDs with a value."""
+        rows = sum(column.present.count(1) for column in self._columns.values())
+        return rows + len(self._values)
+
+    def __repr__(self) -> str:
+        """Return a representation of the store."""
+        return f"{self.__class__.__name__}({dict(self)!r})"
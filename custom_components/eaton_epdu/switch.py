@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
-
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -13,8 +11,6 @@ from .const import (
     DOMAIN,
     SNMP_OID_OUTLETS_DESIGNATOR,
     SNMP_OID_OUTLETS_STATUS,
-    SNMP_OID_OUTLETS_SWITCH_OFF,
-    SNMP_OID_OUTLETS_SWITCH_ON,
     SNMP_OID_UNITS_OUTLET_COUNT,
 )
 from .coordinator import SnmpCoordinator
@@ -32,16 +28,10 @@ async def async_setup_entry(
     for unit in coordinator.get_units():
         for index in range(
             1,
-            coordinator.data.get(SNMP_OID_UNITS_OUTLET_COUNT.replace("unit", unit), 0)
-            + 1,
+            coordinator.get_unit_data(SNMP_OID_UNITS_OUTLET_COUNT, unit, default=0) + 1,
         ):
             if (
-                coordinator.data.get(
-                    SNMP_OID_OUTLETS_STATUS.replace("unit", unit).replace(
-                        "index", str(index)
-                    ),
-                    None,
-                )
+                coordinator.get_unit_data(SNMP_OID_OUTLETS_STATUS, unit, str(index))
                 is not None
             ):
                 switches.append(SnmpSwitchEntity(coordinator, unit, str(index)))
@@ -61,8 +51,10 @@ class SnmpSwitchEntity(SnmpEntity, SwitchEntity):
     def __init__(self, coordinator: SnmpCoordinator, unit: str, index: str) -> None:
         """Initialize a Eaton ePDU outlet switch."""
         super().__init__(coordinator, unit)
-        self._name_oid = self._name_oid.replace("unit", unit).replace("index", index)
-        self._value_oid = self._value_oid.replace("unit", unit).replace("index", index)
+        self._index = index
+        self._name_oid = coordinator.registry.get(self._name_oid, unit, index)
+        self._value_oid = coordinator.registry.get(self._value_oid, unit, index)
+        self.coordinator_context = frozenset((self._value_oid,))
         device_name = self.device_info["name"]
         sensor_name = self.coordinator.data.get(self._name_oid)
         self._attr_name = (
@@ -70,12 +62,10 @@ class SnmpSwitchEntity(SnmpEntity, SwitchEntity):
         )
         self._attr_unique_id = f"{DOMAIN}_{self.identifier}_{self._value_oid}"
 
-        self._oid_on = SNMP_OID_OUTLETS_SWITCH_ON.replace("unit", unit).replace(
-            "index", index
-        )
-        self._oid_off = SNMP_OID_OUTLETS_SWITCH_OFF.replace("unit", unit).replace(
-            "index", index
-        )
+    @property
+    def outlet(self) -> tuple[str, str]:
+        """Return the unit and index of the outlet."""
+        return self._unit, self._index
 
     @property
     def is_on(self) -> bool:
@@ -89,12 +79,8 @@ class SnmpSwitchEntity(SnmpEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn the switch on."""
-        await self.coordinator.set_snmp_value(self._oid_on, 1, "Integer")
-        await asyncio.sleep(2)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_switch_outlet(self._unit, self._index, True)
 
     async def async_turn_off(self, **kwargs):
         """Turn the switch off."""
-        await self.coordinator.set_snmp_value(self._oid_off, 1, "Integer")
-        await asyncio.sleep(2)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_switch_outlet(self._unit, self._index, False)
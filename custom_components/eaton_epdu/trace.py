@@ -0,0 +1,249 @@
+"""Record and replay SNMP traffic of Eaton ePDU."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from datetime import UTC, datetime
+import gzip
+import json
+import random
+import time
+
+from pyasn1.type import univ
+import pysnmp.hlapi.asyncio as hlapi
+from pysnmp.proto import errind, rfc1902, rfc1905
+from pysnmp.smi import view
+
+TRACE_VERSION = 1
+TRACE_FLUSH_RECORDS = 100
+
+# Value types that can appear in a trace.
+VALUE_TYPES = {
+    value_type.__name__: value_type
+    for value_type in (
+        rfc1902.Integer,
+        rfc1902.Integer32,
+        rfc1902.Unsigned32,
+        rfc1902.Gauge32,
+        rfc1902.Counter32,
+        rfc1902.Counter64,
+        rfc1902.TimeTicks,
+        rfc1902.OctetString,
+        rfc1902.IpAddress,
+        rfc1902.Opaque,
+        rfc1902.Bits,
+        rfc1902.ObjectName,
+        univ.ObjectIdentifier,
+        univ.Null,
+        rfc1905.NoSuchObject,
+        rfc1905.NoSuchInstance,
+        rfc1905.EndOfMibView,
+    )
+}
+
+
+def encode_value(value) -> list:
+    """Return a value as its type name and a JSON representation."""
+    name = value.__class__.__name__
+    if isinstance(value, univ.Integer):
+        return [name, int(value)]
+    if isinstance(value, univ.OctetString):
+        return [name, value.asOctets().hex()]
+    if isinstance(value, univ.ObjectIdentifier):
+        return [name, str(value)]
+    return [name, None]
+
+
+def decode_value(name: str, value):
+    """Return the pysnmp value of a type name and JSON representation."""
+    value_type = VALUE_TYPES[name]
+    if issubclass(value_type, univ.OctetString):
+        return value_type(hexValue=value)
+    if issubclass(value_type, univ.Null):
+        return value_type("")
+    return value_type(value)
+
+
+def _oid(var_bind) -> str:
+    """Return the OID of a resolved variable binding."""
+    return str(var_bind[0])
+
+
+class TraceRecorder:
+    """Record requests and responses into a gzip compressed JSON lines file.
+
+    Records are buffered and appended in the executor, so recording does not
+    block the event loop.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the recorder."""
+        self._path = path
+        self._start = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._buffer = [
+            json.dumps(
+                {
+                    "version": TRACE_VERSION,
+                    "started": datetime.now(UTC).isoformat(),
+                }
+            )
+        ]
+
+    @property
+    def pending(self) -> int:
+        """Return the number of buffered records."""
+        return len(self._buffer)
+
+    def record(self, command, args: tuple, response: tuple, rtt: float) -> None:
+        """Buffer a request and its response."""
+        error_indication, error_status, error_index, var_binds = response
+        request = {
+            "t": round(time.monotonic() - self._start - rtt, 6),
+            "rtt": round(rtt, 6),
+            "cmd": command.__name__,
+        }
+        if command.__name__ == "bulk_cmd":
+            request["nr"], request["mr"] = int(args[0]), int(args[1])
+            args = args[2:]
+        request["oids"] = [_oid(var_bind) for var_bind in args]
+        if command.__name__ == "set_cmd":
+            request["values"] = [encode_value(var_bind[1]) for var_bind in args]
+        request["ei"] = str(error_indication) if error_indication else None
+        request["es"] = int(error_status or 0)
+        request["ex"] = int(error_index or 0)
+        request["vbs"] = [
+            [_oid(var_bind), *encode_value(var_bind[1])] for var_bind in var_binds
+        ]
+        self._buffer.append(json.dumps(request, separators=(",", ":")))
+
+    async def async_flush(self) -> None:
+        """Append the buffered records to the trace file."""
+        async with self._lock:
+            lines, self._buffer = self._buffer, []
+            if lines:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._write, lines
+                )
+
+    def _write(self, lines: list[str]) -> None:
+        """Append lines to the trace file."""
+        with gzip.open(self._path, "at", encoding="utf-8") as file:
+            file.writelines(f"{line}\n" for line in lines)
+
+
+class TraceReplay:
+    """Answer requests from a recorded trace instead of a device.
+
+    Requests are matched by command and requested OIDs. Repeated requests are
+    answered with the recorded responses in turn, starting over at the end.
+    The methods stand in for the hlapi commands of the same name.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        latency: float | None = None,
+        loss: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        """Load a trace.
+
+        Args:
+            path: Trace file written by the recorder.
+            latency: Seconds to delay each response, None for the recorded
+                round trip time.
+            loss: Share of requests answered with a timeout.
+            seed: Seed of the loss, for reproducible runs.
+        """
+        self._latency = latency
+        self._loss = loss
+        self._random = random.Random(seed)
+        self._mib_view = view.MibViewController(hlapi.SnmpEngine().get_mib_builder())
+        self._responses: dict[tuple, list[dict]] = defaultdict(list)
+        self._positions: dict[tuple, int] = defaultdict(int)
+        self.requests = 0
+        self.varbinds = 0
+        self.misses = 0
+
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                record = json.loads(line)
+                if "cmd" in record:
+                    key = (
+                        record["cmd"],
+                        record.get("nr"),
+                        record.get("mr"),
+                        tuple(record["oids"]),
+                    )
+                    self._responses[key].append(record)
+
+    def reset(self) -> None:
+        """Reset the request counters."""
+        self.requests = 0
+        self.varbinds = 0
+        self.misses = 0
+
+    async def _replay(self, key: tuple) -> tuple:
+        """Return the next recorded response for a request."""
+        self.requests += 1
+        records = self._responses.get(key)
+        lost = self._loss > 0 and self._random.random() < self._loss
+        if not records or lost:
+            if not records:
+                self.misses += 1
+            return errind.requestTimedOut, 0, 0, ()
+
+        position = self._positions[key]
+        self._positions[key] = (position + 1) % len(records)
+        record = records[position]
+
+        latency = record["rtt"] if self._latency is None else self._latency
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+        var_binds = tuple(
+            (rfc1902.ObjectName(oid), decode_value(name, value))
+            for oid, name, value in record["vbs"]
+        )
+        self.varbinds += len(var_binds)
+        error_indication = record["ei"]
+        if error_indication == str(errind.requestTimedOut):
+            error_indication = errind.requestTimedOut
+        return error_indication, record["es"], record["ex"], var_binds
+
+    def _oids(self, var_binds) -> tuple[str, ...]:
+        """Return the OIDs of request variable bindings."""
+        return tuple(
+            _oid(var_bind.resolve_with_mib(self._mib_view)) for var_bind in var_binds
+        )
+
+    async def get_cmd(self, engine, auth, target, context, *var_binds, **options):
+        """Replay a GET request."""
+        return await self._replay(("get_cmd", None, None, self._oids(var_binds)))
+
+    async def bulk_cmd(
+        self,
+        engine,
+        auth,
+        target,
+        context,
+        non_repeaters,
+        max_repetitions,
+        *var_binds,
+        **options,
+    ):
+        """Replay a GETBULK request."""
+        return await self._replay(
+            (
+                "bulk_cmd",
+                int(non_repeaters),
+                int(max_repetitions),
+                self._oids(var_binds),
+            )
+        )
+
+    async def set_cmd(self, engine, auth, target, context, *var_binds, **options):
+        """Replay a SET request."""
+        return await self._replay(("set_cmd", None, None, self._oids(var_binds)))
@@ -0,0 +1,206 @@
+"""SNMP notification receiver of Eaton ePDU."""
+
+from __future__ import annotations
+
+import logging
+import socket
+
+from pysnmp.carrier.asyncio.dgram import udp, udp6
+from pysnmp.entity import config
+from pysnmp.entity.engine import SnmpEngine
+from pysnmp.entity.rfc3413 import ntfrcv
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .api import SnmpApi
+from .const import (
+    ATTR_RECEIVE_TRAPS,
+    ATTR_TRAP_COMMUNITY,
+    ATTR_TRAP_PORT,
+    DATA_TRAP_RECEIVERS,
+    SNMP_OID_SYSTEM_UPTIME,
+    SNMP_OID_TRAP,
+    SNMP_TRAP_COMMUNITY_DEFAULT,
+    SNMP_TRAP_PORT_DEFAULT,
+)
+from .coordinator import SnmpCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TrapReceiver:
+    """Receive SNMPv1 and SNMPv2c traps and informs on a UDP port.
+
+    A receiver is shared by all config entries using its port. Notifications
+    are passed to the coordinators of the devices they were sent from, if they
+    carry the community configured for the device.
+    """
+
+    def __init__(self, snmpEngine: SnmpEngine, port: int) -> None:
+        """Initialize the receiver."""
+        self._snmpEngine = snmpEngine
+        self.port = port
+        self._receiver: ntfrcv.NotificationReceiver | None = None
+        self.entries: dict[str, tuple[str, str, SnmpCoordinator]] = {}
+        # Community index of every accepted community and the reverse lookup.
+        self._indexes: dict[str, str] = {}
+        self._communities: dict[str, str] = {}
+        self._next_index = 0
+
+    def start(self) -> None:
+        """Listen on the port, raise OSError if it cannot be bound.
+
+        IPv6 is listened on as well where available, on a socket of its own.
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.bind(("0.0.0.0", self.port))
+        except OSError:
+            sock.close()
+            raise
+        config.add_transport(
+            self._snmpEngine,
+            udp.DOMAIN_NAME,
+            udp.UdpAsyncioTransport().open_server_mode(sock=sock),
+        )
+        if socket.has_ipv6:
+            self._start_ipv6()
+        self._receiver = ntfrcv.NotificationReceiver(self._snmpEngine, self._receive)
+
+    def _start_ipv6(self) -> None:
+        """Listen on the port for IPv6, if the host supports it."""
+        try:
+            sock = socket.socket(socket.AF_INET6, socket.SOCK_DGRAM)
+        except OSError as err:
+            _LOGGER.debug("Cannot receive SNMP notifications over IPv6: %s", err)
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 1)
+            sock.bind(("::", self.port))
+        except OSError as err:
+            sock.close()
+            _LOGGER.debug("Cannot receive SNMP notifications over IPv6: %s", err)
+            return
+        config.add_transport(
+            self._snmpEngine,
+            udp6.DOMAIN_NAME,
+            udp6.Udp6AsyncioTransport().open_server_mode(sock=sock),
+        )
+
+    def stop(self) -> None:
+        """Stop listening."""
+        if self._receiver is not None:
+            self._receiver.close(self._snmpEngine)
+            self._receiver = None
+        self._snmpEngine.close_dispatcher()
+
+    def register(
+        self,
+        entry_id: str,
+        address: str,
+        community: str,
+        coordinator: SnmpCoordinator,
+    ) -> None:
+        """Pass the notifications of a device to its coordinator."""
+        self.unregister(entry_id)
+        self.entries[entry_id] = (address, community, coordinator)
+        if community not in self._indexes:
+            index = f"trap{self._next_index}"
+            self._next_index += 1
+            config.add_v1_system(self._snmpEngine, index, community)
+            self._indexes[community] = index
+            self._communities[index] = community
+
+    def unregister(self, entry_id: str) -> None:
+        """Stop passing the notifications of a device to its coordinator."""
+        if (registered := self.entries.pop(entry_id, None)) is None:
+            return
+        community = registered[1]
+        if any(other[1] == community for other in self.entries.values()):
+            return
+        index = self._indexes.pop(community)
+        del self._communities[index]
+        config.delete_v1_system(self._snmpEngine, index)
+
+    def _receive(
+        self,
+        snmpEngine: SnmpEngine,
+        stateReference,
+        contextEngineId,
+        contextName,
+        varBinds,
+        cbCtx,
+    ) -> None:
+        """Decode a notification and pass it to the coordinators of its sender."""
+        context = snmpEngine.observer.get_execution_context(
+            "rfc3412.receiveMessage:request"
+        )
+        address = context["transportAddress"][0]
+        community = self._communities.get(str(context["securityName"]))
+        coordinators = [
+            coordinator
+            for entry_address, entry_community, coordinator in self.entries.values()
+            if entry_address == address and entry_community == community
+        ]
+        if not coordinators:
+            _LOGGER.debug("Ignore notification from unknown device %s", address)
+            return
+
+        values = {str(oid): SnmpApi.decode(value) for oid, value in varBinds}
+        values.pop(SNMP_OID_SYSTEM_UPTIME, None)
+        notification = values.pop(SNMP_OID_TRAP, None)
+        _LOGGER.debug("Notification %s from %s: %s", notification, address, values)
+        for coordinator in coordinators:
+            coordinator.async_handle_notification(notification, values)
+
+
+async def async_setup_trap_receiver(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: SnmpCoordinator
+) -> None:
+    """Receive the notifications of the device of a config entry if enabled."""
+    if not entry.data.get(ATTR_RECEIVE_TRAPS, False):
+        return
+    address = coordinator.address
+    if address is None:
+        return
+
+    port = entry.data.get(ATTR_TRAP_PORT, SNMP_TRAP_PORT_DEFAULT)
+    receivers: dict[int, TrapReceiver] = hass.data.setdefault(DATA_TRAP_RECEIVERS, {})
+    if port not in receivers:
+        # Loading the MIBs of a new engine blocks.
+        snmpEngine = await hass.async_add_executor_job(SnmpEngine)
+        if port not in receivers:
+            receiver = TrapReceiver(snmpEngine, port)
+            try:
+                receiver.start()
+            except OSError as err:
+                _LOGGER.error(
+                    "Cannot receive SNMP notifications on port %d: %s", port, err
+                )
+                return
+            receivers[port] = receiver
+
+    receivers[port].register(
+        entry.entry_id,
+        address,
+        entry.data.get(ATTR_TRAP_COMMUNITY, SNMP_TRAP_COMMUNITY_DEFAULT),
+        coordinator,
+    )
+
+
+@callback
+def async_unload_trap_receiver(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Stop receiving the notifications of a config entry's device.
+
+    The port may have changed in the options already, so the entry is removed
+    from every receiver. Receivers no longer used are stopped.
+    """
+    receivers: dict[int, TrapReceiver] = hass.data.get(DATA_TRAP_RECEIVERS, {})
+    for port, receiver in list(receivers.items()):
+        receiver.unregister(entry.entry_id)
+        if not receiver.entries:
+            receiver.stop()
+            del receivers[port]
+    if not receivers:
+        hass.data.pop(DATA_TRAP_RECEIVERS, None)
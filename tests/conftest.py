@@ -0,0 +1,36 @@
+"""Fixtures for the Eaton ePDU tests."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.eaton_epdu.const import DOMAIN
+from custom_components.eaton_epdu.coordinator import UnitDevice
+from custom_components.eaton_epdu.registry import OidRegistry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable the custom integration in all tests."""
+    return
+
+
+@pytest.fixture
+def coordinator(hass: HomeAssistant) -> MagicMock:
+    """Return a coordinator holding data for the entities under test."""
+    coordinator = MagicMock()
+    coordinator.hass = hass
+    coordinator.config_entry.data = {}
+    coordinator.registry = OidRegistry()
+    coordinator.data = {}
+    coordinator.last_update_success = True
+    coordinator.stale = False
+    coordinator.get_device.return_value = UnitDevice(
+        identifier="BENCH0",
+        info=DeviceInfo(identifiers={(DOMAIN, "BENCH0")}, name="ePDU"),
+    )
+    return coordinator
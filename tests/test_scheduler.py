@@ -0,0 +1,43 @@
+"""Tests for the Eaton ePDU poll scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.eaton_epdu.const import RequestPriority
+from custom_components.eaton_epdu.scheduler import PrioritySemaphore
+
+
+async def test_cancelled_waiter_released_before_it_resumes() -> None:
+    """Test a waiter cancelled and then dropped by a release raises cancelled."""
+    semaphore = PrioritySemaphore(1)
+    await semaphore.acquire()
+    waiter = asyncio.create_task(semaphore.acquire(RequestPriority.POLL))
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    semaphore.release()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    # The slot was not handed to the cancelled waiter and is free again.
+    assert not semaphore.locked()
+    await asyncio.wait_for(semaphore.acquire(), 1)
+
+
+async def test_waiter_cancelled_after_the_slot_was_handed_over() -> None:
+    """Test a slot handed to a waiter cancelled meanwhile is passed on."""
+    semaphore = PrioritySemaphore(1)
+    await semaphore.acquire()
+    first = asyncio.create_task(semaphore.acquire(RequestPriority.POLL))
+    second = asyncio.create_task(semaphore.acquire(RequestPriority.POLL))
+    await asyncio.sleep(0)
+
+    semaphore.release()
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    await asyncio.wait_for(second, 1)
+    assert semaphore.locked()
@@ -0,0 +1,80 @@
+"""Tests for the Eaton ePDU sensors."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockEntityPlatform,
+    async_fire_time_changed,
+)
+
+from custom_components.eaton_epdu.const import ATTR_STALE, SNMP_OID_INPUTS_CURRENT
+from custom_components.eaton_epdu.sensor import (
+    SensorFilter,
+    SnmpInputCurrentSensorEntity,
+)
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+
+@pytest.fixture
+def sensor(hass: HomeAssistant, coordinator: MagicMock) -> SnmpInputCurrentSensorEntity:
+    """Return an input current sensor reading 1.5 A."""
+    coordinator.data[coordinator.registry.get(SNMP_OID_INPUTS_CURRENT, "0", "1")] = 1500
+    entity = SnmpInputCurrentSensorEntity(coordinator, "0", "1")
+    entity.hass = hass
+    entity.platform = MockEntityPlatform(hass)
+    entity.entity_id = "sensor.epdu_input_current"
+    return entity
+
+
+async def test_failed_poll_makes_sensor_unavailable(
+    hass: HomeAssistant, coordinator: MagicMock, sensor: SnmpInputCurrentSensorEntity
+) -> None:
+    """Test an unchanged value is written again when the availability changes."""
+    sensor._handle_coordinator_update()
+    assert hass.states.get(sensor.entity_id).state == "1.5"
+
+    coordinator.last_update_success = False
+    sensor._handle_coordinator_update()
+    assert hass.states.get(sensor.entity_id).state == STATE_UNAVAILABLE
+
+    coordinator.last_update_success = True
+    sensor._handle_coordinator_update()
+    assert hass.states.get(sensor.entity_id).state == "1.5"
+
+
+async def test_first_poll_removes_stale_mark(
+    hass: HomeAssistant, coordinator: MagicMock, sensor: SnmpInputCurrentSensorEntity
+) -> None:
+    """Test an unchanged restored value loses the stale mark on the first poll."""
+    coordinator.stale = True
+    sensor._handle_coordinator_update()
+    assert hass.states.get(sensor.entity_id).attributes.get(ATTR_STALE) is True
+
+    coordinator.stale = False
+    sensor._handle_coordinator_update()
+    assert ATTR_STALE not in hass.states.get(sensor.entity_id).attributes
+
+
+async def test_unchanged_value_written_after_max_silence(
+    hass: HomeAssistant, sensor: SnmpInputCurrentSensorEntity
+) -> None:
+    """Test an unchanged value is written again after the maximum silence."""
+    sensor._filter = SensorFilter(max_silence=60)
+    sensor._handle_coordinator_update()
+    written = hass.states.get(sensor.entity_id).last_reported
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=59))
+    await hass.async_block_till_done()
+    assert hass.states.get(sensor.entity_id).last_reported == written
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=60))
+    await hass.async_block_till_done()
+    state = hass.states.get(sensor.entity_id)
+    assert state.state == "1.5"
+    assert state.last_reported > written